@@ -6,6 +6,7 @@ This script initializes and runs all components of the bot.
 import asyncio
 import os
 import argparse
+import aiohttp
 from dotenv import load_dotenv
 from loguru import logger
 
@@ -17,9 +18,13 @@ from website_monitor.jup_monitor import JupTrenchesMonitor
 from trading.solana_trader import SolanaTrader
 from utils.config import Config
 from utils.logger import setup_logger
+from utils.event_loop import enable_eager_tasks, install_event_loop_policy
 
 async def main():
     """Main function to run the Solana Trading Bot."""
+    # Telethon creates a task per update; short handlers then finish inline
+    enable_eager_tasks()
+    
     # Parse command line arguments
     parser = argparse.ArgumentParser(description="Solana Trading Bot")
     parser.add_argument("--config", type=str, default=".env", help="Path to config file")
@@ -36,6 +41,12 @@ async def main():
     config = Config()
     logger.info("Configuration loaded successfully")
     
+    # Shared HTTP connection pool for trading API requests
+    http_session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=50, ttl_dns_cache=300, keepalive_timeout=30)
+    )
+    
+    interface = None
     try:
         # Initialize components
         user_client = UserClient(
@@ -47,6 +58,8 @@ async def main():
         bot_client = BotClient(
             token=config.bot_token,
             admin_id=config.admin_id,
+            api_id=config.user_api_id,
+            api_hash=config.user_api_hash,
             user_client=user_client
         )
         
@@ -56,7 +69,8 @@ async def main():
             buy_amount=config.buy_amount_sol,
             target_multiplier=config.target_multiplier,
             sell_percentage=config.sell_percentage,
-            auto_trade_enabled=config.auto_trade_enabled
+            auto_trade_enabled=config.auto_trade_enabled,
+            http_session=http_session
         )
         
         # Initialize website monitor if enabled
@@ -77,11 +91,12 @@ async def main():
         # Start all components
         logger.info("Starting all components...")
         
-        # Start the user client for monitoring Telegram groups
-        await user_client.start()
-        
-        # Start the bot client for handling commands
-        await bot_client.start()
+        # Start the user client (group monitoring) and the bot client (commands)
+        # concurrently so their Telegram handshakes overlap
+        await asyncio.gather(
+            user_client.start(),
+            bot_client.start()
+        )
         
         # Start the website monitor if enabled
         if jup_monitor:
@@ -92,17 +107,25 @@ async def main():
         trader.start_monitoring()
         logger.info("Trade monitoring started")
         
-        # Join configured Telegram groups
-        for group in config.telegram_groups:
-            await user_client.join_group(group)
+        # Join configured Telegram groups, a few at a time to avoid flood waits
+        await user_client.join_groups(config.telegram_groups)
         
         logger.info("Bot is now running. Press Ctrl+C to stop.")
         
-        # Keep the bot running
-        await asyncio.gather(
-            user_client.run(),
-            bot_client.run()
-        )
+        # Keep the bot running; if one client fails, cancel the other so
+        # nothing is left orphaned before cleanup (TaskGroup-style, 3.8 compatible)
+        tasks = [
+            asyncio.create_task(user_client.run()),
+            asyncio.create_task(bot_client.run())
+        ]
+        done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        
+        # Re-raise the first failure, if any
+        for task in done:
+            task.result()
     
     except KeyboardInterrupt:
         logger.info("Keyboard interrupt received, shutting down...")
@@ -121,13 +144,23 @@ async def main():
         
         # Stop trade monitoring
         trader.stop_monitoring()
+        await trader.close()
         logger.info("Trade monitoring stopped")
         
+        # Send queued replies before the bot client disconnects
+        if interface:
+            await interface.stop()
+        
         # Stop Telegram clients
         await bot_client.stop()
         await user_client.stop()
         
+        # Close pooled HTTP connections
+        await http_session.close()
+        
         logger.info("Bot stopped successfully")
 
 if __name__ == "__main__":
+    # Use the libuv-based event loop when available
+    install_event_loop_policy()
     asyncio.run(main())
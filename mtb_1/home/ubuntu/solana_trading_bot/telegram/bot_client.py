@@ -3,25 +3,143 @@ Telegram bot client for Solana Trading Bot.
 This module handles the bot client functionality.
 """
 import asyncio
+import contextlib
+import itertools
 import re
-from typing import Callable, Dict, List, Optional, Union
+import time
+from collections import OrderedDict, deque
+from functools import partial, wraps
+from typing import Callable, Dict, List, Optional, Tuple, Union
 from telethon import TelegramClient, events, Button
 from telethon.tl.types import User
 from loguru import logger
 
+from telegram.client_factory import TelegramClientFactory
 from utils.telegram_error_handler import TelegramErrorHandler
 
+# Bot command at the start of a message; group 1 is the command name and group 2
+# is set only when the rest of the message is a single number (e.g. /setbuy 0.5)
+COMMAND_PATTERN = re.compile(r'^/([a-zA-Z0-9_]+)(?:\s+([-+]?\d*\.?\d+)\s*$)?')
+
+# Static command responses
+WELCOME_MESSAGE = (
+    "🤖 **Welcome to Solana Trading Bot!**\n\n"
+    "This bot monitors Telegram groups and jup.ag/trenches for new Solana tokens "
+    "and can automatically trade them.\n\n"
+    "**Commands:**\n"
+    "/help - Show available commands\n"
+    "/status - Show bot status\n"
+    "/settings - Show current settings\n"
+    "/trades - Show active trades\n"
+    "/enable - Enable auto-trading\n"
+    "/disable - Disable auto-trading\n"
+    "/setbuy <amount> - Set buy amount in SOL\n"
+    "/settarget <multiplier> - Set target profit multiplier\n"
+    "/setsell <percentage> - Set sell percentage at target"
+)
+
+HELP_MESSAGE = (
+    "📚 **Available Commands:**\n\n"
+    "/status - Show bot status\n"
+    "/settings - Show current settings\n"
+    "/trades - Show active trades\n"
+    "/enable - Enable auto-trading\n"
+    "/disable - Disable auto-trading\n"
+    "/setbuy <amount> - Set buy amount in SOL\n"
+    "/settarget <multiplier> - Set target profit multiplier\n"
+    "/setsell <percentage> - Set sell percentage at target"
+)
+
+PROMPT_SET_BUY = "Please enter buy amount in SOL using /setbuy <amount>"
+PROMPT_SET_TARGET = "Please enter target multiplier using /settarget <multiplier>"
+PROMPT_SET_SELL = "Please enter sell percentage using /setsell <percentage>"
+
+# How long a notified token is remembered before it can be notified again (seconds)
+DETECTED_TOKEN_TTL = 3600
+
+# Upper bound on remembered tokens; the oldest entry is evicted beyond this
+MAX_DETECTED_TOKENS = 10_000
+
+# Trade button callback data is this prefix followed by a 4-byte big-endian id;
+# no other button's data starts with it
+TRADE_BUTTON_PREFIX = b"T"
+
+# Maximum number of notifications queued or being sent before producers wait
+MAX_PENDING_NOTIFICATIONS = 100
+
+# Maximum number of auto-trade buys in flight at once
+MAX_CONCURRENT_BUYS = 8
+
+# How long the monitored groups count shown by /status is reused (seconds)
+GROUPS_COUNT_TTL = 60
+
+def require_trader(func):
+    """
+    Decorator for command handlers that need the trader component.
+    Replies with an error instead of calling the handler if no trader is set.
+    
+    Args:
+        func: Handler coroutine taking (self, event)
+    
+    Returns:
+        Decorated handler
+    """
+    @wraps(func)
+    async def wrapper(self, event, *args, **kwargs):
+        if self.trader is None:
+            return await self.send_message(
+                event.chat_id,
+                "❌ Trader component not initialized"
+            )
+        return await func(self, event, *args, **kwargs)
+    
+    return wrapper
+
 class BotClient:
     """
     Telegram bot client for handling commands and sending notifications.
     Uses the Telethon library with a bot token.
     """
     
+    # Fixed attribute set: no per-instance __dict__, slot-based attribute reads
+    __slots__ = (
+        'token',
+        'admin_id',
+        'admin_peer',
+        'user_client',
+        'client',
+        'command_handlers',
+        'button_callback',
+        'trader',
+        'detected_tokens',
+        '_rendered_settings',
+        '_settings_buttons',
+        '_status_buttons',
+        '_button_handlers',
+        '_trade_buttons',
+        '_trade_button_ids',
+        '_groups_count_cache',
+        '_buy_semaphore',
+        '_buy_tasks',
+        '_chat_locks',
+        '_handler_tasks',
+        '_notif_queue',
+        '_notif_slots',
+        '_notif_event',
+        '_notif_task',
+        '_run_task',
+        '_cleanup_task',
+    )
+    
     def __init__(
         self,
         token: str,
         admin_id: int,
-        user_client = None
+        api_id: Optional[int] = None,
+        api_hash: Optional[str] = None,
+        user_client = None,
+        session_string: Optional[str] = None,
+        client: Optional[TelegramClient] = None
     ):
         """
         Initialize the bot client.
@@ -29,17 +147,18 @@ class BotClient:
         Args:
             token: Bot token from BotFather
             admin_id: Telegram user ID of the admin
+            api_id: API ID from my.telegram.org
+            api_hash: API hash from my.telegram.org
             user_client: User client instance for group operations
+            session_string: Optional session string for resuming session
+            client: Prebuilt client to use instead of building one from
+                api_id, api_hash and session_string
         """
         self.token = token
         self.admin_id = admin_id
+        self.admin_peer = admin_id  # Replaced by the resolved InputPeer in start()
         self.user_client = user_client
-        self.client = TelegramClient('bot_session', api_id=123456, api_hash='dummy')
-        self.client.parse_mode = 'markdown'
-        
-        # Set bot token
-        self.client.session.set_dc(2, '149.154.167.40', 443)
-        self.client._bot_token = token
+        self.client = client or TelegramClientFactory.build_bot_client(api_id, api_hash, session_string)
         
         # Command handlers
         self.command_handlers = {}
@@ -47,6 +166,74 @@ class BotClient:
         
         # Trading component
         self.trader = None
+        self._rendered_settings = None  # (settings snapshot, rendered message)
+        
+        # The settings keyboard never changes, so build it once
+        self._settings_buttons = [
+            [
+                Button.inline("Set Buy Amount", data="set_buy"),
+                Button.inline("Set Target", data="set_target")
+            ],
+            [
+                Button.inline("Set Sell %", data="set_sell"),
+                Button.inline("Toggle Auto-Trade", data="toggle_auto_trade")
+            ]
+        ]
+        
+        # Status keyboards, keyed by whether auto-trading is currently enabled
+        self._status_buttons = {
+            enabled: [
+                [
+                    Button.inline("Disable Auto-Trade" if enabled else "Enable Auto-Trade",
+                                  data="toggle_auto_trade")
+                ],
+                [
+                    Button.inline("View Settings", data="view_settings"),
+                    Button.inline("View Trades", data="view_trades")
+                ]
+            ]
+            for enabled in (False, True)
+        }
+        
+        # Button callback data -> handler
+        self._button_handlers = {
+            b"toggle_auto_trade": self._toggle_auto_trade,
+            b"view_settings": self.handle_settings,
+            b"view_trades": self.handle_trades,
+            b"set_buy": partial(self._send_prompt, prompt=PROMPT_SET_BUY),
+            b"set_target": partial(self._send_prompt, prompt=PROMPT_SET_TARGET),
+            b"set_sell": partial(self._send_prompt, prompt=PROMPT_SET_SELL),
+        }
+        
+        # Trade button id -> (symbol, address), oldest first; bounded like detected_tokens
+        self._trade_buttons: OrderedDict = OrderedDict()
+        self._trade_button_ids = itertools.count(1)
+        
+        # Recently notified tokens as symbol -> (address, source, timestamp), oldest first
+        self.detected_tokens: OrderedDict = OrderedDict()
+        
+        # Monitored groups count as (value, time.monotonic() of last refresh)
+        self._groups_count_cache = (0, None)
+        
+        # Auto-trade buys; references are held so tasks are not collected mid-flight
+        self._buy_semaphore = asyncio.Semaphore(MAX_CONCURRENT_BUYS)
+        self._buy_tasks = set()
+        
+        # Per-chat handler serialization
+        self._chat_locks = {}
+        self._handler_tasks = set()
+        
+        # Outgoing admin notifications, sent in batches by a worker task
+        self._notif_queue = deque()
+        self._notif_slots = asyncio.Semaphore(MAX_PENDING_NOTIFICATIONS)
+        self._notif_event = None
+        self._notif_task = None
+        
+        # Task running run(); cancelled by stop()
+        self._run_task = None
+        
+        # Background sweep of expired detected tokens
+        self._cleanup_task = None
         
         # Register default handlers
         self._register_default_handlers()
@@ -58,17 +245,99 @@ class BotClient:
         await self.client.start(bot_token=self.token)
         me = await self.client.get_me()
         logger.info(f"Bot started as @{me.username}")
+        
+        # Resolve the admin once so sends don't repeat entity resolution
+        try:
+            self.admin_peer = await self.client.get_input_entity(self.admin_id)
+        except Exception as e:
+            logger.warning(f"Could not resolve admin entity, using raw ID: {str(e)}")
+            self.admin_peer = self.admin_id
+        
+        self._cleanup_task = asyncio.create_task(self._sweep_detected_tokens())
+        
+        self._notif_event = asyncio.Event()
+        if self._notif_queue:
+            self._notif_event.set()
+        self._notif_task = asyncio.create_task(self._notification_worker())
     
     async def stop(self):
         """Stop the bot client."""
+        # Cancellation is the shutdown signal for run()
+        if self._run_task and not self._run_task.done():
+            self._run_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._run_task
+        
+        if self._cleanup_task:
+            self._cleanup_task.cancel()
+            self._cleanup_task = None
+        
+        # Let queued notifications go out before disconnecting
+        if self._notif_task:
+            self._notif_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._notif_task
+            self._notif_task = None
+        await self._flush_notifications()
+        
         await self.client.disconnect()
         logger.info("Bot client stopped")
     
     async def run(self):
         """Run the bot client indefinitely."""
         logger.info("Bot client running...")
+        self._run_task = asyncio.current_task()
+        try:
+            # Idle until cancelled; Telethon handles updates in its own tasks
+            await asyncio.Future()
+        except asyncio.CancelledError:
+            pass
+        finally:
+            self._run_task = None
+    
+    async def _notification_worker(self):
+        """Send queued notifications, draining the whole queue per wakeup."""
+        while True:
+            await self._notif_event.wait()
+            self._notif_event.clear()
+            await self._flush_notifications()
+    
+    async def _flush_notifications(self):
+        """Send every queued notification to the admin concurrently."""
+        if not self._notif_queue:
+            return
+        
+        # Take the current batch; anything queued meanwhile goes in the next one
+        batch = list(self._notif_queue)
+        self._notif_queue.clear()
+        
+        try:
+            await asyncio.gather(
+                *(self.send_message(self.admin_peer, message, buttons=buttons)
+                  for message, buttons in batch),
+                return_exceptions=True
+            )
+        finally:
+            for _ in batch:
+                self._notif_slots.release()
+    
+    async def _sweep_detected_tokens(self, interval: float = 60):
+        """
+        Periodically forget tokens older than DETECTED_TOKEN_TTL.
+        
+        Entries are kept in insertion order, so only the expired prefix is visited.
+        
+        Args:
+            interval: Seconds between sweeps
+        """
         while True:
-            await asyncio.sleep(1)
+            await asyncio.sleep(interval)
+            now = time.monotonic()
+            while self.detected_tokens:
+                oldest = next(iter(self.detected_tokens.values()))
+                if now - oldest[2] < DETECTED_TOKEN_TTL:
+                    break
+                self.detected_tokens.popitem(last=False)
     
     def set_trader(self, trader):
         """
@@ -78,6 +347,7 @@ class BotClient:
             trader: Trader component
         """
         self.trader = trader
+        self._rendered_settings = None
         logger.info("Trader component set")
     
     def register_command_handler(self, command: str, handler: Callable):
@@ -104,34 +374,82 @@ class BotClient:
     def _register_default_handlers(self):
         """Register default command handlers."""
         # Register command handler
-        @self.client.on(events.NewMessage(pattern=r'/[a-zA-Z0-9_]+'))
+        @self.client.on(events.NewMessage(pattern=COMMAND_PATTERN))
         async def handle_command(event):
             """Handle bot commands."""
-            # Extract command
-            command = event.raw_text.split()[0][1:]
+            # Only the admin may control the bot; sender_id needs no extra lookup
+            if event.sender_id != self.admin_id:
+                return
             
-            # Check if handler exists
-            if command in self.command_handlers:
-                try:
-                    await self.command_handlers[command](event)
-                except Exception as e:
-                    logger.error(f"Error handling command /{command}: {str(e)}")
-                    await event.respond(f"❌ Error executing command: {str(e)}")
-            else:
-                await event.respond(f"❌ Unknown command: /{command}")
+            self._spawn_for_chat(event, self._dispatch_command)
         
         # Register button callback handler
         @self.client.on(events.CallbackQuery())
         async def handle_button(event):
             """Handle button callbacks."""
-            if self.button_callback:
-                try:
-                    await self.button_callback(event)
-                except Exception as e:
-                    logger.error(f"Error handling button callback: {str(e)}")
-                    await event.answer(f"Error: {str(e)}", alert=True)
-            else:
-                await event.answer("No button handler registered", alert=True)
+            if event.sender_id != self.admin_id:
+                return
+            
+            self._spawn_for_chat(event, self._dispatch_button)
+    
+    def _spawn_for_chat(self, event, handler: Callable):
+        """
+        Run a handler in its own task, serialized per chat.
+        
+        Updates from one chat keep their order, while a slow handler in one
+        chat never holds up updates from another.
+        
+        Args:
+            event: Telegram event
+            handler: Coroutine function to run with the event
+        """
+        lock = self._chat_locks.setdefault(event.chat_id, asyncio.Lock())
+        task = asyncio.create_task(self._run_with_lock(lock, handler, event))
+        self._handler_tasks.add(task)
+        task.add_done_callback(self._handler_tasks.discard)
+    
+    async def _run_with_lock(self, lock: asyncio.Lock, handler: Callable, event):
+        """Run a handler while holding the chat's lock."""
+        async with lock:
+            await handler(event)
+    
+    async def _dispatch_command(self, event):
+        """
+        Dispatch a bot command to its registered handler.
+        
+        Args:
+            event: Telegram event
+        """
+        # Extract command from the pattern match
+        command = event.pattern_match.group(1)
+        
+        # Look up the handler with a single dict access
+        handler = self.command_handlers.get(command)
+        if handler is None:
+            await event.respond(f"❌ Unknown command: /{command}")
+            return
+        
+        try:
+            await handler(event)
+        except Exception as e:
+            logger.error(f"Error handling command /{command}: {str(e)}")
+            await event.respond(f"❌ Error executing command: {str(e)}")
+    
+    async def _dispatch_button(self, event):
+        """
+        Dispatch a button callback to the registered callback handler.
+        
+        Args:
+            event: Telegram event
+        """
+        if self.button_callback:
+            try:
+                await self.button_callback(event)
+            except Exception as e:
+                logger.error(f"Error handling button callback: {str(e)}")
+                await event.answer(f"Error: {str(e)}", alert=True)
+        else:
+            await event.answer("No button handler registered", alert=True)
     
     @TelegramErrorHandler.handle_telegram_errors
     async def send_message(
@@ -153,6 +471,10 @@ class BotClient:
         Returns:
             Sent message
         """
+        # Replies to the admin chat reuse the InputPeer resolved in start()
+        if user_id == self.admin_id:
+            user_id = self.admin_peer
+        
         return await self.client.send_message(
             user_id,
             text,
@@ -160,7 +482,57 @@ class BotClient:
             link_preview=link_preview
         )
     
-    @TelegramErrorHandler.handle_telegram_errors
+    async def _guarded_buy(self, symbol: str, address: str):
+        """
+        Buy a token for auto-trading, bounded by MAX_CONCURRENT_BUYS.
+        
+        Args:
+            symbol: Token symbol
+            address: Token address
+        """
+        async with self._buy_semaphore:
+            try:
+                await self.trader.buy_token(symbol, address)
+            except Exception as e:
+                logger.error(f"Auto-trade buy failed for {symbol}: {str(e)}")
+    
+    def _make_trade_button_data(self, symbol: str, address: str) -> bytes:
+        """
+        Register a token for a trade button and build its callback data.
+        
+        Telegram caps callback data at 64 bytes, which a symbol plus a base58
+        address can exceed, so the button only carries a short id.
+        
+        Args:
+            symbol: Token symbol
+            address: Token address
+        
+        Returns:
+            bytes: Callback data for the trade button
+        """
+        button_id = next(self._trade_button_ids) & 0xFFFFFFFF
+        self._trade_buttons[button_id] = (symbol, address)
+        if len(self._trade_buttons) > MAX_DETECTED_TOKENS:
+            self._trade_buttons.popitem(last=False)
+        
+        return TRADE_BUTTON_PREFIX + button_id.to_bytes(4, "big")
+    
+    def resolve_trade_button(self, data: bytes) -> Optional[Tuple[str, str]]:
+        """
+        Look up the token behind a trade button's callback data.
+        
+        Args:
+            data: Raw callback data
+        
+        Returns:
+            Optional[Tuple[str, str]]: (symbol, address), or None if the data is
+            not a trade button or the button has expired
+        """
+        if len(data) != 5 or data[:1] != TRADE_BUTTON_PREFIX:
+            return None
+        
+        return self._trade_buttons.get(int.from_bytes(data[1:], "big"))
+    
     async def send_token_notification(self, token_data: Dict):
         """
         Send a notification about a detected token.
@@ -177,40 +549,60 @@ class BotClient:
             logger.warning(f"No address for token {symbol}, skipping notification")
             return
         
-        # Create notification message
-        message = (
-            f"🔔 **New Token Detected!**\n\n"
-            f"🔹 Symbol: **{symbol}**\n"
+        # Expired entries are swept in the background; only this token's
+        # entry is checked here
+        now = time.monotonic()
+        previous = self.detected_tokens.pop(symbol, None)
+        if previous and now - previous[2] < DETECTED_TOKEN_TTL:
+            self.detected_tokens[symbol] = previous
+            logger.debug(f"Token {symbol} already notified, skipping")
+            return
+        
+        # Keep the map bounded even if tokens arrive faster than they expire
+        if len(self.detected_tokens) >= MAX_DETECTED_TOKENS:
+            self.detected_tokens.popitem(last=False)
+        
+        self.detected_tokens[symbol] = (address, source, now)
+        
+        # Create notification message (joined once at the end)
+        parts = [
+            "🔔 **New Token Detected!**\n\n",
+            f"🔹 Symbol: **{symbol}**\n",
             f"🔹 Address: `{address}`\n"
-        )
+        ]
         
         if price:
-            message += f"🔹 Price: **{price}**\n"
+            parts.append(f"🔹 Price: **{price}**\n")
         
-        message += f"🔹 Source: **{source}**\n\n"
+        parts.append(f"🔹 Source: **{source}**\n\n")
         
         # Add auto-trade status
         if self.trader and self.trader.auto_trade_enabled:
-            message += "🤖 Auto-trading is enabled. Trading this token automatically."
+            parts.append("🤖 Auto-trading is enabled. Trading this token automatically.")
             
             # Auto-trade the token
-            asyncio.create_task(self.trader.buy_token(symbol, address))
+            task = asyncio.create_task(self._guarded_buy(symbol, address))
+            self._buy_tasks.add(task)
+            task.add_done_callback(self._buy_tasks.discard)
         else:
-            message += "🤖 Auto-trading is disabled. Click the button below to trade this token."
+            parts.append("🤖 Auto-trading is disabled. Click the button below to trade this token.")
+        
+        message = "".join(parts)
         
         # Add buttons
         buttons = [
-            [Button.inline(f"Trade {symbol}", data=f"trade_{symbol}_{address}")]
+            [Button.inline(f"Trade {symbol}", data=self._make_trade_button_data(symbol, address))]
         ]
         
-        # Send notification to admin
-        await self.send_message(
-            self.admin_id,
-            message,
-            buttons=buttons
-        )
+        # Queue the notification for the batch sender so a slow Telegram
+        # round-trip does not hold up the caller's detection loop; once
+        # MAX_PENDING_NOTIFICATIONS are outstanding, wait for sends to finish
+        await self._notif_slots.acquire()
+        self._notif_queue.append((message, buttons))
+        if self._notif_event:
+            self._notif_event.set()
         
-        logger.info(f"Sent notification for token {symbol}")
+        logger.info(f"Queued notification for token {symbol}")
     
     async def handle_start(self, event):
         """
@@ -219,25 +611,9 @@ class BotClient:
         Args:
             event: Telegram event
         """
-        welcome_message = (
-            "🤖 **Welcome to Solana Trading Bot!**\n\n"
-            "This bot monitors Telegram groups and jup.ag/trenches for new Solana tokens "
-            "and can automatically trade them.\n\n"
-            "**Commands:**\n"
-            "/help - Show available commands\n"
-            "/status - Show bot status\n"
-            "/settings - Show current settings\n"
-            "/trades - Show active trades\n"
-            "/enable - Enable auto-trading\n"
-            "/disable - Disable auto-trading\n"
-            "/setbuy <amount> - Set buy amount in SOL\n"
-            "/settarget <multiplier> - Set target profit multiplier\n"
-            "/setsell <percentage> - Set sell percentage at target"
-        )
-        
         await self.send_message(
             event.chat_id,
-            welcome_message
+            WELCOME_MESSAGE
         )
     
     async def handle_help(self, event):
@@ -247,23 +623,32 @@ class BotClient:
         Args:
             event: Telegram event
         """
-        help_message = (
-            "📚 **Available Commands:**\n\n"
-            "/status - Show bot status\n"
-            "/settings - Show current settings\n"
-            "/trades - Show active trades\n"
-            "/enable - Enable auto-trading\n"
-            "/disable - Disable auto-trading\n"
-            "/setbuy <amount> - Set buy amount in SOL\n"
-            "/settarget <multiplier> - Set target profit multiplier\n"
-            "/setsell <percentage> - Set sell percentage at target"
-        )
-        
         await self.send_message(
             event.chat_id,
-            help_message
+            HELP_MESSAGE
         )
     
+    async def _get_groups_count(self) -> int:
+        """
+        Get the number of monitored groups, refreshing at most every GROUPS_COUNT_TTL seconds.
+        
+        Returns:
+            int: Number of titled dialogs visible to the user client
+        """
+        if not self.user_client:
+            return 0
+        
+        count, refreshed_at = self._groups_count_cache
+        now = time.monotonic()
+        if refreshed_at is not None and now - refreshed_at < GROUPS_COUNT_TTL:
+            return count
+        
+        groups = await self.user_client.get_dialogs()
+        count = sum(1 for g in groups if getattr(g.entity, 'title', None))
+        self._groups_count_cache = (count, now)
+        return count
+    
+    @require_trader
     async def handle_status(self, event):
         """
         Handle /status command.
@@ -271,15 +656,19 @@ class BotClient:
         Args:
             event: Telegram event
         """
-        if not self.trader:
-            await self.send_message(
-                event.chat_id,
-                "❌ Trader component not initialized"
-            )
-            return
+        # Wallet balance and monitored groups count are independent RPCs; fetch them together
+        sol_balance, groups_count = await asyncio.gather(
+            self.trader.wallet.get_sol_balance(),
+            self._get_groups_count(),
+            return_exceptions=True
+        )
         
-        # Get wallet balance
-        sol_balance = await self.trader.wallet.get_sol_balance()
+        # The balance is essential; the groups count is shown as unknown if it failed
+        if isinstance(sol_balance, BaseException):
+            raise sol_balance
+        if isinstance(groups_count, BaseException):
+            logger.warning(f"Could not get monitored groups count: {str(groups_count)}")
+            groups_count = "?"
         
         # Get active trades count
         active_trades = len(self.trader.active_trades)
@@ -287,12 +676,6 @@ class BotClient:
         # Get auto-trade status
         auto_trade_status = "Enabled" if self.trader.auto_trade_enabled else "Disabled"
         
-        # Get monitored groups count
-        groups_count = 0
-        if self.user_client:
-            groups = await self.user_client.get_dialogs()
-            groups_count = sum(1 for g in groups if hasattr(g.entity, 'title') and g.entity.title)
-        
         status_message = (
             "📊 **Bot Status:**\n\n"
             f"🔹 Auto-Trading: **{auto_trade_status}**\n"
@@ -301,24 +684,13 @@ class BotClient:
             f"🔹 Monitoring: **{groups_count} Telegram groups**\n"
         )
         
-        # Add buttons
-        buttons = [
-            [
-                Button.inline("Enable Auto-Trade" if not self.trader.auto_trade_enabled else "Disable Auto-Trade", 
-                             data="toggle_auto_trade")
-            ],
-            [
-                Button.inline("View Settings", data="view_settings"),
-                Button.inline("View Trades", data="view_trades")
-            ]
-        ]
-        
         await self.send_message(
             event.chat_id,
             status_message,
-            buttons=buttons
+            buttons=self._status_buttons[self.trader.auto_trade_enabled]
         )
     
+    @require_trader
     async def handle_settings(self, event):
         """
         Handle /settings command.
@@ -326,39 +698,32 @@ class BotClient:
         Args:
             event: Telegram event
         """
-        if not self.trader:
-            await self.send_message(
-                event.chat_id,
-                "❌ Trader component not initialized"
-            )
-            return
-        
-        settings_message = (
-            "⚙️ **Current Settings:**\n\n"
-            f"🔹 Auto-Trading: **{'Enabled' if self.trader.auto_trade_enabled else 'Disabled'}**\n"
-            f"🔹 Buy Amount: **{self.trader.buy_amount} SOL**\n"
-            f"🔹 Target Multiplier: **{self.trader.target_multiplier}x**\n"
-            f"🔹 Sell Percentage: **{self.trader.sell_percentage}%**\n"
+        # Re-render only when a setting changed since the last call
+        settings_key = (
+            self.trader.auto_trade_enabled,
+            self.trader.buy_amount,
+            self.trader.target_multiplier,
+            self.trader.sell_percentage
         )
+        if self._rendered_settings is None or self._rendered_settings[0] != settings_key:
+            settings_message = (
+                "⚙️ **Current Settings:**\n\n"
+                f"🔹 Auto-Trading: **{'Enabled' if self.trader.auto_trade_enabled else 'Disabled'}**\n"
+                f"🔹 Buy Amount: **{self.trader.buy_amount} SOL**\n"
+                f"🔹 Target Multiplier: **{self.trader.target_multiplier}x**\n"
+                f"🔹 Sell Percentage: **{self.trader.sell_percentage}%**\n"
+            )
+            self._rendered_settings = (settings_key, settings_message)
         
-        # Add buttons
-        buttons = [
-            [
-                Button.inline("Set Buy Amount", data="set_buy"),
-                Button.inline("Set Target", data="set_target")
-            ],
-            [
-                Button.inline("Set Sell %", data="set_sell"),
-                Button.inline("Toggle Auto-Trade", data="toggle_auto_trade")
-            ]
-        ]
+        settings_message = self._rendered_settings[1]
         
         await self.send_message(
             event.chat_id,
             settings_message,
-            buttons=buttons
+            buttons=self._settings_buttons
         )
     
+    @require_trader
     async def handle_trades(self, event):
         """
         Handle /trades command.
@@ -366,13 +731,6 @@ class BotClient:
         Args:
             event: Telegram event
         """
-        if not self.trader:
-            await self.send_message(
-                event.chat_id,
-                "❌ Trader component not initialized"
-            )
-            return
-        
         active_trades = self.trader.get_active_trades()
         
         if not active_trades:
@@ -382,21 +740,22 @@ class BotClient:
             )
             return
         
-        trades_message = "📈 **Active Trades:**\n\n"
-        
-        for i, trade in enumerate(active_trades, 1):
-            trades_message += (
-                f"**{i}. {trade['symbol']}**\n"
-                f"🔹 Amount: {trade['amount']:.4f}\n"
-                f"🔹 Current Value: {trade['current_value']:.4f} SOL\n"
-                f"🔹 Profit: {trade['profit_percentage']:.2f}%\n\n"
-            )
+        parts = ["📈 **Active Trades:**\n\n"]
+        parts.extend(
+            f"**{i}. {trade['symbol']}**\n"
+            f"🔹 Amount: {trade['amount']:.4f}\n"
+            f"🔹 Current Value: {trade['current_value']:.4f} SOL\n"
+            f"🔹 Profit: {trade['profit_percentage']:.2f}%\n\n"
+            for i, trade in enumerate(active_trades, 1)
+        )
+        trades_message = "".join(parts)
         
         await self.send_message(
             event.chat_id,
             trades_message
         )
     
+    @require_trader
     async def handle_enable(self, event):
         """
         Handle /enable command.
@@ -404,13 +763,6 @@ class BotClient:
         Args:
             event: Telegram event
         """
-        if not self.trader:
-            await self.send_message(
-                event.chat_id,
-                "❌ Trader component not initialized"
-            )
-            return
-        
         self.trader.set_auto_trade_enabled(True)
         
         await self.send_message(
@@ -418,6 +770,7 @@ class BotClient:
             "✅ Auto-trading has been **enabled**."
         )
     
+    @require_trader
     async def handle_disable(self, event):
         """
         Handle /disable command.
@@ -425,13 +778,6 @@ class BotClient:
         Args:
             event: Telegram event
         """
-        if not self.trader:
-            await self.send_message(
-                event.chat_id,
-                "❌ Trader component not initialized"
-            )
-            return
-        
         self.trader.set_auto_trade_enabled(False)
         
         await self.send_message(
@@ -439,6 +785,7 @@ class BotClient:
             "❌ Auto-trading has been **disabled**."
         )
     
+    @require_trader
     async def handle_set_buy(self, event):
         """
         Handle /setbuy command.
@@ -446,25 +793,18 @@ class BotClient:
         Args:
             event: Telegram event
         """
-        if not self.trader:
-            await self.send_message(
-                event.chat_id,
-                "❌ Trader component not initialized"
-            )
-            return
-        
         try:
             # Extract amount from command
-            command = event.raw_text.split()
+            argument = event.pattern_match.group(2)
             
-            if len(command) < 2:
+            if argument is None:
                 await self.send_message(
                     event.chat_id,
                     "❌ Please specify an amount: /setbuy <amount>"
                 )
                 return
             
-            amount = float(command[1])
+            amount = float(argument)
             
             if amount <= 0:
                 await self.send_message(
@@ -480,12 +820,6 @@ class BotClient:
                 f"✅ Buy amount set to **{amount} SOL**."
             )
         
-        except ValueError:
-            await self.send_message(
-                event.chat_id,
-                "❌ Invalid amount. Please specify a valid number."
-            )
-        
         except Exception as e:
             logger.error(f"Error handling setbuy command: {str(e)}")
             await self.send_message(
@@ -493,6 +827,7 @@ class BotClient:
                 "❌ An error occurred while setting buy amount."
             )
     
+    @require_trader
     async def handle_set_target(self, event):
         """
         Handle /settarget command.
@@ -500,25 +835,18 @@ class BotClient:
         Args:
             event: Telegram event
         """
-        if not self.trader:
-            await self.send_message(
-                event.chat_id,
-                "❌ Trader component not initialized"
-            )
-            return
-        
         try:
             # Extract multiplier from command
-            command = event.raw_text.split()
+            argument = event.pattern_match.group(2)
             
-            if len(command) < 2:
+            if argument is None:
                 await self.send_message(
                     event.chat_id,
                     "❌ Please specify a multiplier: /settarget <multiplier>"
                 )
                 return
             
-            multiplier = float(command[1])
+            multiplier = float(argument)
             
             if multiplier <= 1:
                 await self.send_message(
@@ -534,12 +862,6 @@ class BotClient:
                 f"✅ Target multiplier set to **{multiplier}x**."
             )
         
-        except ValueError:
-            await self.send_message(
-                event.chat_id,
-                "❌ Invalid multiplier. Please specify a valid number."
-            )
-        
         except Exception as e:
             logger.error(f"Error handling settarget command: {str(e)}")
             await self.send_message(
@@ -547,6 +869,7 @@ class BotClient:
                 "❌ An error occurred while setting target multiplier."
             )
     
+    @require_trader
     async def handle_set_sell(self, event):
         """
         Handle /setsell command.
@@ -554,25 +877,18 @@ class BotClient:
         Args:
             event: Telegram event
         """
-        if not self.trader:
-            await self.send_message(
-                event.chat_id,
-                "❌ Trader component not initialized"
-            )
-            return
-        
         try:
             # Extract percentage from command
-            command = event.raw_text.split()
+            argument = event.pattern_match.group(2)
             
-            if len(command) < 2:
+            if argument is None:
                 await self.send_message(
                     event.chat_id,
                     "❌ Please specify a percentage: /setsell <percentage>"
                 )
                 return
             
-            percentage = float(command[1])
+            percentage = float(argument)
             
             if percentage <= 0 or percentage > 100:
                 await self.send_message(
@@ -588,12 +904,6 @@ class BotClient:
                 f"✅ Sell percentage set to **{percentage}%**."
             )
         
-        except ValueError:
-            await self.send_message(
-                event.chat_id,
-                "❌ Invalid percentage. Please specify a valid number."
-            )
-        
         except Exception as e:
             logger.error(f"Error handling setsell command: {str(e)}")
             await self.send_message(
@@ -601,6 +911,31 @@ class BotClient:
                 "❌ An error occurred while setting sell percentage."
             )
     
+    async def _toggle_auto_trade(self, event):
+        """
+        Flip auto-trading and refresh the status message.
+        
+        Args:
+            event: Telegram event
+        """
+        new_state = not self.trader.auto_trade_enabled
+        self.trader.set_auto_trade_enabled(new_state)
+        
+        await event.answer(f"Auto-trading {'enabled' if new_state else 'disabled'}")
+        
+        # Update message
+        await self.handle_status(event)
+    
+    async def _send_prompt(self, event, prompt: str):
+        """
+        Reply to a settings button with its usage prompt.
+        
+        Args:
+            event: Telegram event
+            prompt: Prompt text to send
+        """
+        await self.send_message(event.chat_id, prompt)
+    
     async def handle_button(self, event):
         """
         Handle button callbacks.
@@ -614,53 +949,17 @@ class BotClient:
         
         try:
             # Get button data
-            data = event.data.decode("utf-8")
-            
-            if data == "toggle_auto_trade":
-                # Toggle auto-trade
-                new_state = not self.trader.auto_trade_enabled
-                self.trader.set_auto_trade_enabled(new_state)
-                
-                await event.answer(f"Auto-trading {'enabled' if new_state else 'disabled'}")
-                
-                # Update message
-                await self.handle_status(event)
-            
-            elif data == "view_settings":
-                # Show settings
-                await self.handle_settings(event)
-            
-            elif data == "view_trades":
-                # Show trades
-                await self.handle_trades(event)
-            
-            elif data == "set_buy":
-                # Prompt for buy amount
-                await self.send_message(
-                    event.chat_id,
-                    "Please enter buy amount in SOL using /setbuy <amount>"
-                )
-            
-            elif data == "set_target":
-                # Prompt for target multiplier
-                await self.send_message(
-                    event.chat_id,
-                    "Please enter target multiplier using /settarget <multiplier>"
-                )
+            data = event.data
             
-            elif data == "set_sell":
-                # Prompt for sell percentage
-                await self.send_message(
-                    event.chat_id,
-                    "Please enter sell percentage using /setsell <percentage>"
-                )
+            handler = self._button_handlers.get(data)
+            if handler:
+                await handler(event)
             
-            elif data.startswith("trade_"):
+            elif data[:1] == TRADE_BUTTON_PREFIX:
                 # Handle token trade button
-                token_data = data.split("_")[1:]
-                if len(token_data) >= 2:
-                    symbol = token_data[0]
-                    address = token_data[1]
+                token = self.resolve_trade_button(data)
+                if token:
+                    symbol, address = token
                     
                     # Buy token
                     success = await self.trader.buy_token(symbol, address)
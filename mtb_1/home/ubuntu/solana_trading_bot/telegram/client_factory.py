@@ -2,6 +2,7 @@
 Telegram client factory for creating and managing Telegram clients.
 This module provides a factory for creating both user and bot clients.
 """
+import asyncio
 import os
 from typing import Optional, Tuple
 from telethon import TelegramClient
@@ -60,9 +61,40 @@ class TelegramClientFactory:
         
         return client, session_string
     
+    @staticmethod
+    def build_bot_client(
+        api_id: int,
+        api_hash: str,
+        session_string: Optional[str] = None
+    ) -> TelegramClient:
+        """
+        Build an unstarted bot client on an in-memory session.
+        
+        No network or disk I/O happens here; the data center is resolved when
+        the client is started with the bot token.
+        
+        Args:
+            api_id: API ID from my.telegram.org
+            api_hash: API hash from my.telegram.org
+            session_string: Optional session string for resuming session
+        
+        Returns:
+            TelegramClient: Client that has not been started yet
+        """
+        if session_string:
+            logger.info("Using existing session")
+        else:
+            logger.info("Creating new session")
+        
+        client = TelegramClient(StringSession(session_string), api_id, api_hash)
+        client.parse_mode = 'markdown'
+        return client
+    
     @staticmethod
     async def create_bot_client(
         token: str,
+        api_id: int,
+        api_hash: str,
         session_string: Optional[str] = None
     ) -> Tuple[TelegramClient, str]:
         """
@@ -70,6 +102,8 @@ class TelegramClientFactory:
         
         Args:
             token: Bot token from BotFather
+            api_id: API ID from my.telegram.org
+            api_hash: API hash from my.telegram.org
             session_string: Optional session string for resuming session
         
         Returns:
@@ -77,20 +111,8 @@ class TelegramClientFactory:
         """
         logger.info("Creating bot client...")
         
-        # Extract API ID and hash from token (dummy values, will be overridden)
-        api_id = 1
-        api_hash = "1"
-        
-        # Create session
-        if session_string:
-            session = StringSession(session_string)
-            logger.info("Using existing session")
-        else:
-            session = StringSession()
-            logger.info("Creating new session")
-        
         # Create client
-        client = TelegramClient(session, api_id, api_hash)
+        client = TelegramClientFactory.build_bot_client(api_id, api_hash, session_string)
         
         # Start client
         await client.start(bot_token=token)
@@ -107,9 +129,9 @@ class TelegramClientFactory:
         return client, session_string
     
     @staticmethod
-    def save_session(session_string: str, filename: str) -> bool:
+    async def save_session(session_string: str, filename: str) -> bool:
         """
-        Save session string to file.
+        Save session string to file without blocking the event loop.
         
         Args:
             session_string: Session string to save
@@ -119,12 +141,10 @@ class TelegramClientFactory:
             True if successful, False otherwise
         """
         try:
-            # Create directory if it doesn't exist
-            os.makedirs(os.path.dirname(filename), exist_ok=True)
-            
-            # Save session string
-            with open(filename, 'w') as f:
-                f.write(session_string)
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(
+                None, TelegramClientFactory._write_session_file, session_string, filename
+            )
             
             logger.info(f"Session saved to {filename}")
             return True
@@ -134,9 +154,9 @@ class TelegramClientFactory:
             return False
     
     @staticmethod
-    def load_session(filename: str) -> Optional[str]:
+    async def load_session(filename: str) -> Optional[str]:
         """
-        Load session string from file.
+        Load session string from file without blocking the event loop.
         
         Args:
             filename: Filename to load from
@@ -145,18 +165,36 @@ class TelegramClientFactory:
             Session string if successful, None otherwise
         """
         try:
-            # Check if file exists
-            if not os.path.exists(filename):
+            loop = asyncio.get_running_loop()
+            session_string = await loop.run_in_executor(
+                None, TelegramClientFactory._read_session_file, filename
+            )
+            
+            if session_string is None:
                 logger.warning(f"Session file {filename} does not exist")
                 return None
             
-            # Load session string
-            with open(filename, 'r') as f:
-                session_string = f.read().strip()
-            
             logger.info(f"Session loaded from {filename}")
             return session_string
         
         except Exception as e:
             logger.error(f"Error loading session: {str(e)}")
             return None
+    
+    @staticmethod
+    def _write_session_file(session_string: str, filename: str):
+        """Blocking half of save_session; runs in the default executor."""
+        # Create directory if it doesn't exist
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        
+        with open(filename, 'w') as f:
+            f.write(session_string)
+    
+    @staticmethod
+    def _read_session_file(filename: str) -> Optional[str]:
+        """Blocking half of load_session; runs in the default executor."""
+        if not os.path.exists(filename):
+            return None
+        
+        with open(filename, 'r') as f:
+            return f.read().strip()
@@ -3,8 +3,10 @@ Group manager for Telegram integration.
 This module handles joining and managing Telegram groups.
 """
 import asyncio
+import random
 import re
-from typing import List, Optional, Dict
+import time
+from typing import Any, List, Optional, Dict, Tuple
 from telethon import TelegramClient
 from telethon.tl.functions.messages import ImportChatInviteRequest, CheckChatInviteRequest
 from telethon.tl.functions.channels import JoinChannelRequest, GetFullChannelRequest
@@ -18,24 +20,142 @@ from telethon.errors import (
 )
 from loguru import logger
 
+from telegram.group_store import GroupStore
+
+# Bare group username, accepted in place of a full link
+USERNAME_PATTERN = re.compile(r'^[a-zA-Z0-9_]+$')
+
+# Private invite hash (URL-safe base64 alphabet)
+INVITE_HASH_PATTERN = re.compile(r'^[A-Za-z0-9_-]{10,}$')
+
+# Prefixes of links _clean_group_link treats as Telegram links
+TME_PREFIXES = ('https://t.me/', 'http://t.me/', 't.me/')
+
+# How long a CheckChatInviteRequest result is reused (seconds)
+INVITE_CACHE_TTL = 300
+
+# Join attempts per link, and the longest flood wait worth sleeping through (seconds)
+JOIN_MAX_ATTEMPTS = 3
+JOIN_MAX_FLOOD_WAIT = 300
+
+# Upper bound of the random delay added when resuming after a flood wait (seconds)
+FLOOD_WAIT_JITTER = 0.5
+
+# Maximum number of concurrent group info lookups in get_joined_groups
+GROUP_INFO_CONCURRENCY = 16
+
+class GroupInfo:
+    """
+    Information about a joined Telegram group.
+    Slotted to keep the per-group cache entry small.
+    """
+    
+    __slots__ = ('id', 'title', 'username', 'invite_link', 'member_count')
+    
+    def __init__(
+        self,
+        id: int,
+        title: str,
+        username: Optional[str],
+        invite_link: Optional[str],
+        member_count: int
+    ):
+        self.id = id
+        self.title = title
+        self.username = username
+        self.invite_link = invite_link
+        self.member_count = member_count
+    
+    def to_dict(self) -> Dict:
+        """
+        Convert to a plain dictionary.
+        
+        Returns:
+            Dict: Group information dictionary
+        """
+        return {name: getattr(self, name) for name in self.__slots__}
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'GroupInfo':
+        """
+        Build from a dictionary produced by to_dict.
+        
+        Args:
+            data: Group information dictionary
+        
+        Returns:
+            GroupInfo: Group information
+        """
+        return cls(**data)
+
 class TelegramGroupManager:
     """
     Manager for Telegram groups.
     Handles joining and managing Telegram groups.
     """
     
-    def __init__(self, client: TelegramClient):
+    def __init__(
+        self,
+        client: TelegramClient,
+        join_concurrency: int = 4,
+        store: Optional[GroupStore] = None
+    ):
         """
         Initialize the group manager.
         
         Args:
-            client: Telethon client instance (user client)
+            client: Telethon client instance (user client). Pass the owning
+                UserClient's client rather than creating another one; managers
+                on the same client share its connection and flood-wait budget.
+            join_concurrency: Maximum number of joins join_groups runs at once.
+                Every join is an account-level request, so keep this small;
+                larger values mostly trade latency for FloodWait errors.
+            store: Optional store that keeps joined_groups across restarts
         """
         self.client = client
         self.joined_groups = {}
+        self.store = store
+        self._save_tasks = set()
+        self._group_info_inflight: Dict[int, asyncio.Future] = {}  # group ID -> pending lookup
+        self._flood_until = 0.0  # time.monotonic() before which no join is sent
+        self._join_semaphore = asyncio.Semaphore(join_concurrency)
+        self._invite_cache: Dict[str, Tuple[float, Any]] = {}  # hash -> (checked at, result)
         logger.info("Telegram group manager initialized")
     
-    async def join_group(self, group_link: str) -> Optional[Dict]:
+    async def load_cache(self):
+        """Fill joined_groups from the store, if one is configured."""
+        if self.store:
+            stored = await self.store.load()
+            for group_id, info in stored.items():
+                # Entries written by another version may not fit GroupInfo;
+                # skip them and let the next dialogs refresh fetch them again
+                try:
+                    self.joined_groups[group_id] = GroupInfo.from_dict(info)
+                except (TypeError, AttributeError) as e:
+                    logger.warning(f"Skipping cached group {group_id}: {str(e)}")
+    
+    def _cache_group(self, group_id: int, group_info: GroupInfo):
+        """
+        Store group information in joined_groups and persist it in the background.
+        
+        Args:
+            group_id: ID of the group
+            group_info: Group information
+        """
+        self.joined_groups[group_id] = group_info
+        self._schedule_save()
+    
+    def _schedule_save(self):
+        """Write a snapshot of joined_groups to the store without blocking the caller."""
+        if not self.store:
+            return
+        
+        snapshot = {group_id: info.to_dict() for group_id, info in self.joined_groups.items()}
+        task = asyncio.create_task(self.store.save(snapshot))
+        self._save_tasks.add(task)
+        task.add_done_callback(self._save_tasks.discard)
+    
+    async def join_group(self, group_link: str) -> Optional[GroupInfo]:
         """
         Join a Telegram group using an invite link.
         
@@ -43,37 +163,76 @@ class TelegramGroupManager:
             group_link: Invite link for the group (e.g., https://t.me/group or https://t.me/joinchat/hash)
         
         Returns:
-            Optional[Dict]: Group information if joined successfully, None otherwise
+            Optional[GroupInfo]: Group information if joined successfully, None otherwise
         """
-        logger.info(f"Attempting to join group: {group_link}")
+        # Values are passed as arguments so loguru only formats records a sink will emit
+        logger.info("Attempting to join group: {}", group_link)
         
-        try:
-            # Clean and validate the link
-            group_link = self._clean_group_link(group_link)
-            if not group_link:
-                logger.error("Invalid group link format")
-                return None
+        # Clean and validate the link
+        group_link = self._clean_group_link(group_link)
+        if not group_link:
+            logger.error("Invalid group link format")
+            return None
+        
+        for attempt in range(1, JOIN_MAX_ATTEMPTS + 1):
+            await self._wait_for_flood_window()
             
-            # Check if it's a public group or private group
-            if 'joinchat' in group_link:
-                # Private group with invite hash
-                return await self._join_private_group(group_link)
-            else:
-                # Public group with username
-                return await self._join_public_group(group_link)
+            try:
+                # Check if it's a public group or private group
+                if 'joinchat' in group_link:
+                    # Private group with invite hash
+                    return await self._join_private_group(group_link)
+                else:
+                    # Public group with username
+                    return await self._join_public_group(group_link)
+            
+            except FloodWaitError as e:
+                # Handle rate limiting
+                wait_time = e.seconds
+                if attempt == JOIN_MAX_ATTEMPTS or wait_time > JOIN_MAX_FLOOD_WAIT:
+                    logger.error(f"Giving up on group {group_link}: rate limited for {wait_time} seconds")
+                    return None
+                
+                logger.warning(f"Rate limited when joining group. Need to wait {wait_time} seconds")
+                
+                # Every join waits out the same window before its next attempt
+                self._flood_until = max(self._flood_until, time.monotonic() + wait_time)
+            
+            except Exception as e:
+                logger.error(f"Failed to join group {group_link}: {str(e)}")
+                return None
+        
+        return None
+    
+    async def _wait_for_flood_window(self):
+        """Sleep until a flood wait reported by any join has passed, plus a little jitter."""
+        delay = self._flood_until - time.monotonic()
+        if delay > 0:
+            # Jitter keeps the waiting joins from all resuming at the same instant
+            await asyncio.sleep(delay + random.uniform(0, FLOOD_WAIT_JITTER))
+    
+    async def join_groups(self, group_links: List[str]) -> List[GroupInfo]:
+        """
+        Join several Telegram groups concurrently, bounded by join_concurrency.
         
-        except FloodWaitError as e:
-            # Handle rate limiting
-            wait_time = e.seconds
-            logger.warning(f"Rate limited when joining group. Need to wait {wait_time} seconds")
-            await asyncio.sleep(wait_time)
-            return await self.join_group(group_link)
+        Args:
+            group_links: Invite links for the groups
         
-        except Exception as e:
-            logger.error(f"Failed to join group {group_link}: {str(e)}")
-            return None
+        Returns:
+            List[GroupInfo]: Information for each group joined successfully
+        """
+        async def bounded_join(group_link: str) -> Optional[GroupInfo]:
+            async with self._join_semaphore:
+                return await self.join_group(group_link)
+        
+        results = await asyncio.gather(
+            *(bounded_join(group_link) for group_link in group_links),
+            return_exceptions=True
+        )
+        
+        return [result for result in results if isinstance(result, GroupInfo)]
     
-    async def _join_private_group(self, group_link: str) -> Optional[Dict]:
+    async def _join_private_group(self, group_link: str) -> Optional[GroupInfo]:
         """
         Join a private Telegram group using an invite hash.
         
@@ -81,83 +240,85 @@ class TelegramGroupManager:
             group_link: Invite link for the private group
         
         Returns:
-            Optional[Dict]: Group information if joined successfully, None otherwise
+            Optional[GroupInfo]: Group information if joined successfully, None otherwise
         """
+        # Extract the hash from the invite link
+        invite_hash = group_link.rpartition('/')[2]
+        
+        # Reject malformed hashes locally instead of spending a round trip on them
+        if not INVITE_HASH_PATTERN.match(invite_hash):
+            logger.error(f"Invalid invite hash in link: {group_link}")
+            return None
+        
         try:
-            # Extract the hash from the invite link
-            invite_hash = group_link.split('/')[-1]
-            
-            # Check the invite before joining
-            try:
-                invite_info = await self.client(CheckChatInviteRequest(invite_hash))
-                logger.info(f"Invite info: {invite_info.title}")
-            except Exception as e:
-                logger.warning(f"Could not check invite info: {str(e)}")
-            
             # Try to join the group
             try:
                 updates = await self.client(ImportChatInviteRequest(invite_hash))
-                
-                # Extract group info from the updates
-                for update in updates.updates:
-                    if hasattr(update, 'chat_id'):
-                        chat_id = update.chat_id
-                        chat = await self.client.get_entity(chat_id)
-                        
-                        group_info = {
-                            'id': chat_id,
-                            'title': getattr(chat, 'title', 'Unknown'),
-                            'username': getattr(chat, 'username', None),
-                            'invite_link': group_link,
-                            'member_count': getattr(chat, 'participants_count', 0)
-                        }
-                        
-                        # Store in joined groups
-                        self.joined_groups[chat_id] = group_info
-                        
-                        logger.info(f"Successfully joined private group: {group_info['title']}")
-                        return group_info
-            
             except UserAlreadyParticipantError:
                 logger.info("Already a member of this group")
                 
-                # Try to get group info
-                try:
-                    # We need to find the chat ID from the invite hash
-                    # This is a bit tricky, but we can try to get it from the updates
-                    invite_info = await self.client(CheckChatInviteRequest(invite_hash))
-                    if hasattr(invite_info, 'chat'):
-                        chat = invite_info.chat
-                        chat_id = chat.id
-                        
-                        group_info = {
-                            'id': chat_id,
-                            'title': getattr(chat, 'title', 'Unknown'),
-                            'username': getattr(chat, 'username', None),
-                            'invite_link': group_link,
-                            'member_count': getattr(chat, 'participants_count', 0)
-                        }
-                        
-                        # Store in joined groups
-                        self.joined_groups[chat_id] = group_info
-                        
-                        return group_info
-                except Exception as e:
-                    logger.error(f"Error getting group info: {str(e)}")
+                # The invite check returns the chat once we are a member
+                invite_info = await self._check_invite(invite_hash)
+                chat = getattr(invite_info, 'chat', None)
+                return self._cache_new_group(chat, group_link) if chat else None
             
-            except (InviteHashEmptyError, InviteHashExpiredError, InviteHashInvalidError) as e:
-                logger.error(f"Invalid invite hash: {str(e)}")
+            # The joined chat comes back with the updates
+            chats = getattr(updates, 'chats', None)
+            if chats:
+                chat = chats[0]
+            else:
+                # Fall back to finding the chat ID in the updates
+                chat_id = next(
+                    (update.chat_id for update in updates.updates if hasattr(update, 'chat_id')),
+                    None
+                )
+                if chat_id is None:
+                    return None
+                chat = await self.client.get_entity(chat_id)
             
-            except Exception as e:
-                logger.error(f"Error joining private group: {str(e)}")
+            group_info = self._cache_new_group(chat, group_link)
             
-            return None
+            logger.info("Successfully joined private group: {}", group_info.title)
+            return group_info
+        
+        except (InviteHashEmptyError, InviteHashExpiredError, InviteHashInvalidError) as e:
+            self._invite_cache.pop(invite_hash, None)
+            logger.error(f"Invalid invite hash: {str(e)}")
+        
+        except FloodWaitError:
+            # Let join_group apply its retry policy
+            raise
         
         except Exception as e:
-            logger.error(f"Error in _join_private_group: {str(e)}")
-            return None
+            logger.error(f"Error joining private group: {str(e)}")
+        
+        return None
     
-    async def _join_public_group(self, group_link: str) -> Optional[Dict]:
+    async def _check_invite(self, invite_hash: str) -> Any:
+        """
+        Check an invite hash, reusing a result fetched within INVITE_CACHE_TTL.
+        
+        Args:
+            invite_hash: Invite hash from a private group link
+        
+        Returns:
+            Any: Result of CheckChatInviteRequest
+        """
+        cached = self._invite_cache.get(invite_hash)
+        now = time.monotonic()
+        if cached and now - cached[0] < INVITE_CACHE_TTL:
+            return cached[1]
+        
+        try:
+            invite_info = await self.client(CheckChatInviteRequest(invite_hash))
+        except (InviteHashExpiredError, InviteHashInvalidError):
+            self._invite_cache.pop(invite_hash, None)
+            raise
+        
+        self._invite_cache[invite_hash] = (now, invite_info)
+        return invite_info
+    
+    async def _join_public_group(self, group_link: str) -> Optional[GroupInfo]:
         """
         Join a public Telegram group using a username.
         
@@ -165,79 +326,108 @@ class TelegramGroupManager:
             group_link: Invite link for the public group
         
         Returns:
-            Optional[Dict]: Group information if joined successfully, None otherwise
+            Optional[GroupInfo]: Group information if joined successfully, None otherwise
         """
+        # Extract the username from the link
+        username = group_link.rpartition('/')[2]
+        
+        if not USERNAME_PATTERN.match(username):
+            logger.error(f"Invalid group username in link: {group_link}")
+            return None
+        
         try:
-            # Extract the username from the link
-            username = group_link.split('/')[-1]
-            
+            # Try to join the channel/group
+            channel = None
             try:
-                # Try to join the channel/group
                 updates = await self.client(JoinChannelRequest(username))
+                joined = True
                 
-                # Get the channel entity
-                channel = await self.client.get_entity(username)
-                
-                # Get full channel info
-                try:
-                    full_channel = await self.client(GetFullChannelRequest(channel=channel))
-                    member_count = full_channel.full_chat.participants_count
-                except Exception as e:
-                    logger.warning(f"Could not get full channel info: {str(e)}")
-                    member_count = 0
-                
-                group_info = {
-                    'id': channel.id,
-                    'title': getattr(channel, 'title', 'Unknown'),
-                    'username': username,
-                    'invite_link': group_link,
-                    'member_count': member_count
-                }
-                
-                # Store in joined groups
-                self.joined_groups[channel.id] = group_info
-                
-                logger.info(f"Successfully joined public group: {group_info['title']}")
-                return group_info
-            
+                # The joined channel normally comes back with the updates
+                lowered = username.lower()
+                channel = next(
+                    (chat for chat in getattr(updates, 'chats', ())
+                     if (getattr(chat, 'username', None) or '').lower() == lowered),
+                    None
+                )
             except UserAlreadyParticipantError:
                 logger.info("Already a member of this group")
-                
-                # Get the channel entity
-                channel = await self.client.get_entity(username)
-                
-                # Get full channel info
-                try:
-                    full_channel = await self.client(GetFullChannelRequest(channel=channel))
-                    member_count = full_channel.full_chat.participants_count
-                except Exception as e:
-                    logger.warning(f"Could not get full channel info: {str(e)}")
-                    member_count = 0
-                
-                group_info = {
-                    'id': channel.id,
-                    'title': getattr(channel, 'title', 'Unknown'),
-                    'username': username,
-                    'invite_link': group_link,
-                    'member_count': member_count
-                }
-                
-                # Store in joined groups
-                self.joined_groups[channel.id] = group_info
-                
-                return group_info
+                joined = False
             
-            except ChannelPrivateError:
-                logger.error("Cannot join private channel with username, need invite link")
+            # Get the channel entity
+            if channel is None:
+                channel = await self.client.get_entity(username)
             
-            except Exception as e:
-                logger.error(f"Error joining public group: {str(e)}")
+            group_info = self._cache_new_group(
+                channel,
+                group_link,
+                member_count=await self._get_member_count(channel),
+                username=username
+            )
             
-            return None
+            if joined:
+                logger.info("Successfully joined public group: {}", group_info.title)
+            return group_info
+        
+        except ChannelPrivateError:
+            logger.error("Cannot join private channel with username, need invite link")
+        
+        except FloodWaitError:
+            # Let join_group apply its retry policy
+            raise
         
         except Exception as e:
-            logger.error(f"Error in _join_public_group: {str(e)}")
-            return None
+            logger.error(f"Error joining public group: {str(e)}")
+        
+        return None
+    
+    def _cache_new_group(
+        self,
+        chat,
+        invite_link: str,
+        member_count: Optional[int] = None,
+        username: Optional[str] = None
+    ) -> GroupInfo:
+        """
+        Build group information for a joined chat and store it in joined groups.
+        
+        Args:
+            chat: Chat or channel entity
+            invite_link: Link the group was joined with
+            member_count: Member count; defaults to the entity's participants_count
+            username: Group username; defaults to the entity's username
+        
+        Returns:
+            GroupInfo: Group information
+        """
+        group_info = GroupInfo(
+            id=chat.id,
+            title=getattr(chat, 'title', 'Unknown'),
+            username=username if username is not None else getattr(chat, 'username', None),
+            invite_link=invite_link,
+            member_count=member_count if member_count is not None else getattr(chat, 'participants_count', 0)
+        )
+        
+        # Store in joined groups
+        self._cache_group(group_info.id, group_info)
+        
+        return group_info
+    
+    async def _get_member_count(self, channel) -> int:
+        """
+        Get a channel's member count from its full info.
+        
+        Args:
+            channel: Channel entity
+        
+        Returns:
+            int: Member count, or 0 if the full info is unavailable
+        """
+        try:
+            full_channel = await self.client(GetFullChannelRequest(channel=channel))
+            return full_channel.full_chat.participants_count
+        except Exception as e:
+            logger.warning(f"Could not get full channel info: {str(e)}")
+            return 0
     
     def _clean_group_link(self, group_link: str) -> Optional[str]:
         """
@@ -252,10 +442,14 @@ class TelegramGroupManager:
         # Remove whitespace
         group_link = group_link.strip()
         
+        # Already canonical; nothing below would change it
+        if group_link.startswith('https://t.me/'):
+            return group_link
+        
         # Check if it's a valid Telegram link
-        if not group_link.startswith(('https://t.me/', 'http://t.me/', 't.me/')):
+        if not group_link.startswith(TME_PREFIXES):
             # Try to add the prefix
-            if not re.match(r'^[a-zA-Z0-9_]+$', group_link):
+            if not USERNAME_PATTERN.match(group_link):
                 logger.error(f"Invalid group link format: {group_link}")
                 return None
             
@@ -266,7 +460,7 @@ class TelegramGroupManager:
         if group_link.startswith('t.me/'):
             group_link = f"https://{group_link}"
         elif group_link.startswith('http://'):
-            group_link = group_link.replace('http://', 'https://')
+            group_link = 'https://' + group_link[7:]
         
         return group_link
     
@@ -288,52 +482,77 @@ class TelegramGroupManager:
             await self.client.delete_dialog(group)
             
             # Remove from joined groups
-            if group_id in self.joined_groups:
-                del self.joined_groups[group_id]
+            if self.joined_groups.pop(group_id, None) is not None:
+                self._schedule_save()
             
-            logger.info(f"Successfully left group: {getattr(group, 'title', 'Unknown')}")
+            logger.info("Successfully left group: {}", getattr(group, 'title', 'Unknown'))
             return True
         
         except Exception as e:
             logger.error(f"Error leaving group {group_id}: {str(e)}")
             return False
     
-    async def get_group_info(self, group_id: int) -> Optional[Dict]:
+    async def get_group_info(self, group_id: int, update_cache: bool = True) -> Optional[GroupInfo]:
         """
         Get information about a joined group.
         
         Args:
             group_id: ID of the group
+            update_cache: Whether to store a fetched result in joined groups;
+                bulk callers pass False and store all results at once
         
         Returns:
-            Optional[Dict]: Group information or None if not found
+            Optional[GroupInfo]: Group information or None if not found
         """
         # Check if we have it cached
         if group_id in self.joined_groups:
             return self.joined_groups[group_id]
         
+        # Share a lookup that is already in flight for this group
+        pending = self._group_info_inflight.get(group_id)
+        if pending:
+            group_info = await pending
+        else:
+            future = asyncio.get_running_loop().create_future()
+            self._group_info_inflight[group_id] = future
+            try:
+                group_info = await self._fetch_group_info(group_id)
+                future.set_result(group_info)
+            finally:
+                del self._group_info_inflight[group_id]
+                if not future.done():
+                    future.cancel()
+        
+        # Store in joined groups
+        if group_info and update_cache and group_id not in self.joined_groups:
+            self._cache_group(group_id, group_info)
+        
+        return group_info
+    
+    async def _fetch_group_info(self, group_id: int) -> Optional[GroupInfo]:
+        """
+        Fetch information about a group from Telegram.
+        
+        Args:
+            group_id: ID of the group
+        
+        Returns:
+            Optional[GroupInfo]: Group information or None if not found
+        """
         try:
             # Get the group entity
             group = await self.client.get_entity(group_id)
             
             # Get full channel info if it's a channel
-            try:
-                full_channel = await self.client(GetFullChannelRequest(channel=group))
-                member_count = full_channel.full_chat.participants_count
-            except Exception as e:
-                logger.warning(f"Could not get full channel info: {str(e)}")
-                member_count = 0
+            member_count = await self._get_member_count(group)
             
-            group_info = {
-                'id': group_id,
-                'title': getattr(group, 'title', 'Unknown'),
-                'username': getattr(group, 'username', None),
-                'invite_link': f"https://t.me/{group.username}" if getattr(group, 'username', None) else None,
-                'member_count': member_count
-            }
-            
-            # Store in joined groups
-            self.joined_groups[group_id] = group_info
+            group_info = GroupInfo(
+                id=group_id,
+                title=getattr(group, 'title', 'Unknown'),
+                username=getattr(group, 'username', None),
+                invite_link=f"https://t.me/{group.username}" if getattr(group, 'username', None) else None,
+                member_count=member_count
+            )
             
             return group_info
         
@@ -341,24 +560,72 @@ class TelegramGroupManager:
             logger.error(f"Error getting group info for {group_id}: {str(e)}")
             return None
     
-    async def get_joined_groups(self) -> List[Dict]:
+    async def get_joined_groups(
+        self,
+        limit: Optional[int] = None,
+        include_archived: bool = True
+    ) -> Tuple[GroupInfo, ...]:
         """
-        Get a list of all joined groups.
+        Get all joined groups.
+        
+        Dialogs come most recently active first, so a small limit (e.g. 50) is
+        a cheap incremental refresh that picks up newly joined groups, while the
+        default fetches every dialog for a full refresh that also drops groups
+        no longer among them.
+        
+        Args:
+            limit: Maximum number of dialogs to fetch, or None for all
+            include_archived: Whether to look at archived dialogs too
         
         Returns:
-            List[Dict]: List of group information dictionaries
+            Tuple[GroupInfo, ...]: Snapshot of the information for every joined group
         """
         # Update the cache with the latest information
         try:
-            dialogs = await self.client.get_dialogs()
+            dialogs = await self.client.get_dialogs(
+                limit=limit,
+                archived=None if include_archived else False
+            )
+            
+            joined_groups = self.joined_groups
+            changed = False
+            
+            # A full refresh sees every dialog, so cached groups missing from it
+            # were left, kicked from or deleted
+            if limit is None and include_archived:
+                dialog_ids = {dialog.id for dialog in dialogs}
+                stale = [group_id for group_id in joined_groups if group_id not in dialog_ids]
+                for group_id in stale:
+                    del joined_groups[group_id]
+                changed = bool(stale)
+            
+            # Only groups and channels that are not cached yet need a lookup
+            missing = [
+                dialog.id for dialog in dialogs
+                if dialog.id not in joined_groups and (dialog.is_group or dialog.is_channel)
+            ]
+            
+            if missing:
+                # Get group info concurrently, a bounded number at a time
+                semaphore = asyncio.Semaphore(GROUP_INFO_CONCURRENCY)
+                
+                async def fetch_group_info(group_id: int) -> Optional[GroupInfo]:
+                    async with semaphore:
+                        return await self.get_group_info(group_id, update_cache=False)
+                
+                results = await asyncio.gather(*map(fetch_group_info, missing))
+                
+                # Store everything fetched at once, with a single persisted snapshot
+                fetched = {group_id: info for group_id, info in zip(missing, results) if info}
+                if fetched:
+                    joined_groups.update(fetched)
+                    changed = True
             
-            for dialog in dialogs:
-                if dialog.is_group or dialog.is_channel:
-                    # Get group info
-                    await self.get_group_info(dialog.id)
+            if changed:
+                self._schedule_save()
         
         except Exception as e:
             logger.error(f"Error getting dialogs: {str(e)}")
         
         # Return the cached groups
-        return list(self.joined_groups.values())
+        return tuple(self.joined_groups.values())
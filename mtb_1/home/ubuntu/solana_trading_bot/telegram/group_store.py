@@ -0,0 +1,87 @@
+"""
+Group store for Telegram integration.
+This module persists the group manager's joined groups cache to disk.
+"""
+import asyncio
+import json
+import os
+from typing import Dict
+from loguru import logger
+
+class GroupStore:
+    """
+    JSON file store for joined group information.
+    File I/O runs in the default executor so the event loop never blocks on disk.
+    """
+    
+    def __init__(self, filename: str):
+        """
+        Initialize the group store.
+        
+        Args:
+            filename: Path of the JSON file holding the cache
+        """
+        self.filename = filename
+        self._lock = asyncio.Lock()
+    
+    async def load(self) -> Dict[int, Dict]:
+        """
+        Load stored group information.
+        
+        Returns:
+            Dict[int, Dict]: Group information keyed by group ID, empty if nothing is stored
+        """
+        try:
+            loop = asyncio.get_running_loop()
+            groups = await loop.run_in_executor(None, self._read, self.filename)
+            
+            logger.info(f"Loaded {len(groups)} cached groups from {self.filename}")
+            return groups
+        
+        except Exception as e:
+            logger.error(f"Error loading group cache: {str(e)}")
+            return {}
+    
+    async def save(self, groups: Dict[int, Dict]) -> bool:
+        """
+        Replace the stored group information.
+        
+        Args:
+            groups: Group information keyed by group ID
+        
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            # Saves are serialized so an older snapshot never overwrites a newer one
+            async with self._lock:
+                loop = asyncio.get_running_loop()
+                await loop.run_in_executor(None, self._write, self.filename, groups)
+            return True
+        
+        except Exception as e:
+            logger.error(f"Error saving group cache: {str(e)}")
+            return False
+    
+    @staticmethod
+    def _read(filename: str) -> Dict[int, Dict]:
+        """Blocking half of load; runs in the default executor."""
+        if not os.path.exists(filename):
+            return {}
+        
+        with open(filename, 'r') as f:
+            data = json.load(f)
+        
+        # JSON object keys are strings
+        return {int(group_id): info for group_id, info in data.items()}
+    
+    @staticmethod
+    def _write(filename: str, groups: Dict[int, Dict]):
+        """Blocking half of save; runs in the default executor."""
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        
+        # Write to a temporary file and swap it in, so a crash never leaves a partial file
+        tmp_filename = f"{filename}.tmp"
+        with open(tmp_filename, 'w') as f:
+            json.dump(groups, f)
+        os.replace(tmp_filename, filename)
@@ -3,20 +3,108 @@ Telegram bot interface for Solana trading bot.
 This module connects the Telegram bot with the trading logic.
 """
 import asyncio
-from typing import Dict, List, Optional
+import time
+from typing import Dict, List, Optional, Tuple
 from telethon import Button
 from loguru import logger
 
-from telegram.bot_client import BotClient
+from telegram.bot_client import (
+    BotClient, WELCOME_MESSAGE, HELP_MESSAGE,
+    PROMPT_SET_BUY, PROMPT_SET_TARGET, PROMPT_SET_SELL
+)
 from trading.solana_trader import SolanaTrader
 from website_monitor.jup_monitor import JupTrenchesMonitor
 
+# Outgoing replies are collected for up to this long (seconds) and this many
+# messages, then consecutive plain-text replies to the same chat are merged
+SEND_BATCH_WINDOW = 0.05
+SEND_BATCH_SIZE = 20
+
+# Telegram's limit on the length of a single message
+MAX_MESSAGE_LENGTH = 4096
+
+# How long a fetched wallet balance is reused by /status (seconds)
+BALANCE_CACHE_TTL = 2.0
+
+# Panel templates, filled in with str.format
+STATUS_TEMPLATE = (
+    "📊 **Bot Status:**\n\n"
+    "🔹 Auto-Trading: **{auto_trade}**\n"
+    "🔹 SOL Balance: **{sol_balance:.4f} SOL**\n"
+    "🔹 Active Trades: **{active_trades}**\n"
+    "🔹 Monitoring: **{groups} Telegram groups**\n"
+)
+
+SETTINGS_TEMPLATE = (
+    "⚙️ **Current Settings:**\n\n"
+    "🔹 Auto-Trading: **{auto_trade}**\n"
+    "🔹 Buy Amount: **{buy_amount} SOL**\n"
+    "🔹 Target Multiplier: **{target_multiplier}x**\n"
+    "🔹 Sell Percentage: **{sell_percentage}%**\n"
+)
+
+# Line appended to the status panel while the website monitor is running
+WEBSITE_MONITORING_LINE = "🔹 Website Monitoring: **Active**\n"
+
 class TelegramInterface:
     """
     Interface between Telegram bot and trading logic.
     Handles commands, notifications, and inline buttons.
     """
     
+    # Inline button data mapped to the name of the method handling it
+    _CALLBACKS = {
+        b"toggle_auto_trade": "_cb_toggle",
+        b"toggle_auto_trade_settings": "_cb_toggle",
+        b"view_status": "_cb_view_status",
+        b"view_settings": "_cb_view_settings",
+        b"view_trades": "_cb_view_trades",
+        b"set_buy": "_cb_prompt",
+        b"set_target": "_cb_prompt",
+        b"set_sell": "_cb_prompt",
+    }
+    
+    # Usage replies for the "Set ..." buttons
+    _PROMPTS = {
+        b"set_buy": PROMPT_SET_BUY,
+        b"set_target": PROMPT_SET_TARGET,
+        b"set_sell": PROMPT_SET_SELL,
+    }
+    
+    # Status keyboards, keyed by whether auto-trading is currently enabled
+    _STATUS_BUTTONS = {
+        enabled: [
+            [
+                Button.inline("Disable Auto-Trade" if enabled else "Enable Auto-Trade",
+                              data="toggle_auto_trade")
+            ],
+            [
+                Button.inline("View Settings", data="view_settings"),
+                Button.inline("View Trades", data="view_trades")
+            ]
+        ]
+        for enabled in (False, True)
+    }
+    
+    # Settings keyboard; it never changes, so every panel shares it
+    _SETTINGS_BUTTONS = [
+        [
+            Button.inline("Set Buy Amount", data="set_buy"),
+            Button.inline("Set Target", data="set_target")
+        ],
+        [
+            Button.inline("Set Sell %", data="set_sell"),
+            Button.inline("Toggle Auto-Trade", data="toggle_auto_trade_settings")
+        ]
+    ]
+    
+    # Trades keyboard, leading back to the status panel
+    _TRADES_BUTTONS = [
+        [
+            Button.inline("Back", data="view_status")
+        ]
+    ]
+    
     def __init__(
         self,
         bot_client: BotClient,
@@ -36,6 +124,13 @@ class TelegramInterface:
         self.jup_monitor = jup_monitor
         self.admin_id = bot_client.admin_id
         
+        # Outgoing replies as (chat_id, text, buttons), sent by a worker task
+        self._send_queue = asyncio.Queue()
+        self._send_task = None
+        
+        # Wallet balance as (value, time.monotonic() of fetch)
+        self._balance_cache = (0.0, None)
+        
         # Register command handlers
         self._register_handlers()
         
@@ -45,6 +140,90 @@ class TelegramInterface:
         
         logger.info("Telegram interface initialized")
     
+    async def _send(self, chat_id: int, text: str, buttons=None):
+        """
+        Queue a reply for the send worker.
+        
+        Args:
+            chat_id: Chat to send to
+            text: Message text
+            buttons: Optional inline keyboard; messages with buttons are never merged
+        """
+        if self._send_task is None or self._send_task.done():
+            self._send_task = asyncio.create_task(self._send_worker())
+        
+        await self._send_queue.put((chat_id, text, buttons))
+    
+    async def _send_worker(self):
+        """Send queued replies, merging bursts of plain-text replies per chat."""
+        loop = asyncio.get_running_loop()
+        
+        while True:
+            item = await self._send_queue.get()
+            if item is None:
+                return
+            batch = [item]
+            stopping = False
+            
+            # Collect whatever else arrives within the batching window
+            deadline = loop.time() + SEND_BATCH_WINDOW
+            while len(batch) < SEND_BATCH_SIZE:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._send_queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+            
+            for chat_id, text, buttons in self._merge_replies(batch):
+                try:
+                    await self.bot.send_message(chat_id, text, buttons=buttons)
+                except Exception as e:
+                    logger.error(f"Error sending message to {chat_id}: {str(e)}")
+            
+            if stopping:
+                return
+    
+    async def stop(self):
+        """Send any queued replies and stop the send worker."""
+        if self._send_task is None or self._send_task.done():
+            if self._send_queue.empty():
+                return
+            self._send_task = asyncio.create_task(self._send_worker())
+        
+        # None tells the worker to exit once everything queued before it is sent
+        await self._send_queue.put(None)
+        await self._send_task
+        self._send_task = None
+        logger.info("Telegram interface stopped")
+    
+    @staticmethod
+    def _merge_replies(batch: List) -> List:
+        """
+        Merge consecutive plain-text replies to the same chat, keeping order.
+        
+        Args:
+            batch: Queued (chat_id, text, buttons) tuples
+        
+        Returns:
+            List: (chat_id, text, buttons) tuples to send
+        """
+        merged = []
+        for chat_id, text, buttons in batch:
+            if merged and buttons is None:
+                last_chat_id, last_text, last_buttons = merged[-1]
+                if (last_chat_id == chat_id and last_buttons is None
+                        and len(last_text) + len(text) + 2 <= MAX_MESSAGE_LENGTH):
+                    merged[-1] = (chat_id, f"{last_text}\n\n{text}", None)
+                    continue
+            merged.append((chat_id, text, buttons))
+        return merged
+    
     def _register_handlers(self):
         """Register command handlers with the bot client."""
         # Register command handlers
@@ -71,25 +250,9 @@ class TelegramInterface:
         Args:
             event: Telegram event
         """
-        welcome_message = (
-            "🤖 **Welcome to Solana Trading Bot!**\n\n"
-            "This bot monitors Telegram groups and jup.ag/trenches for new Solana tokens "
-            "and can automatically trade them.\n\n"
-            "**Commands:**\n"
-            "/help - Show available commands\n"
-            "/status - Show bot status\n"
-            "/settings - Show current settings\n"
-            "/trades - Show active trades\n"
-            "/enable - Enable auto-trading\n"
-            "/disable - Disable auto-trading\n"
-            "/setbuy <amount> - Set buy amount in SOL\n"
-            "/settarget <multiplier> - Set target profit multiplier\n"
-            "/setsell <percentage> - Set sell percentage at target"
-        )
-        
-        await self.bot.client.send_message(
+        await self._send(
             event.chat_id,
-            welcome_message
+            WELCOME_MESSAGE
         )
     
     async def _handle_help(self, event):
@@ -99,23 +262,30 @@ class TelegramInterface:
         Args:
             event: Telegram event
         """
-        help_message = (
-            "📚 **Available Commands:**\n\n"
-            "/status - Show bot status\n"
-            "/settings - Show current settings\n"
-            "/trades - Show active trades\n"
-            "/enable - Enable auto-trading\n"
-            "/disable - Disable auto-trading\n"
-            "/setbuy <amount> - Set buy amount in SOL\n"
-            "/settarget <multiplier> - Set target profit multiplier\n"
-            "/setsell <percentage> - Set sell percentage at target"
-        )
-        
-        await self.bot.client.send_message(
+        await self._send(
             event.chat_id,
-            help_message
+            HELP_MESSAGE
         )
     
+    async def _get_sol_balance(self, max_age: Optional[float] = BALANCE_CACHE_TTL) -> float:
+        """
+        Get the wallet's SOL balance, reusing a recently fetched value.
+        
+        Args:
+            max_age: Oldest cached value to reuse (seconds), None to reuse any
+        
+        Returns:
+            float: SOL balance
+        """
+        balance, fetched_at = self._balance_cache
+        now = time.monotonic()
+        if fetched_at is not None and (max_age is None or now - fetched_at < max_age):
+            return balance
+        
+        balance = await self.trader.wallet.get_sol_balance()
+        self._balance_cache = (balance, now)
+        return balance
+    
     async def _handle_status(self, event):
         """
         Handle /status command.
@@ -124,42 +294,37 @@ class TelegramInterface:
             event: Telegram event
         """
         # Get wallet balance
-        sol_balance = await self.trader.wallet.get_sol_balance()
+        sol_balance = await self._get_sol_balance()
         
-        # Get active trades count
-        active_trades = len(self.trader.active_trades)
+        status_message, buttons = self._render_status(sol_balance)
+        
+        await self._send(
+            event.chat_id,
+            status_message,
+            buttons=buttons
+        )
+    
+    def _render_status(self, sol_balance: float) -> Tuple[str, List]:
+        """
+        Build the status panel.
         
-        # Get auto-trade status
-        auto_trade_status = "Enabled" if self.trader.auto_trade_enabled else "Disabled"
+        Args:
+            sol_balance: Wallet SOL balance to display
         
-        status_message = (
-            "📊 **Bot Status:**\n\n"
-            f"🔹 Auto-Trading: **{auto_trade_status}**\n"
-            f"🔹 SOL Balance: **{sol_balance:.4f} SOL**\n"
-            f"🔹 Active Trades: **{active_trades}**\n"
-            f"🔹 Monitoring: **{len(self.bot.user_client.groups)} Telegram groups**\n"
+        Returns:
+            Tuple[str, List]: Status message and its inline keyboard
+        """
+        status_message = STATUS_TEMPLATE.format(
+            auto_trade="Enabled" if self.trader.auto_trade_enabled else "Disabled",
+            sol_balance=sol_balance,
+            active_trades=len(self.trader.active_trades),
+            groups=len(self.bot.user_client.groups)
         )
         
         if self.jup_monitor:
-            status_message += f"🔹 Website Monitoring: **Active**\n"
+            status_message += WEBSITE_MONITORING_LINE
         
-        # Add buttons
-        buttons = [
-            [
-                Button.inline("Enable Auto-Trade" if not self.trader.auto_trade_enabled else "Disable Auto-Trade", 
-                             data=f"toggle_auto_trade")
-            ],
-            [
-                Button.inline("View Settings", data="view_settings"),
-                Button.inline("View Trades", data="view_trades")
-            ]
-        ]
-        
-        await self.bot.client.send_message(
-            event.chat_id,
-            status_message,
-            buttons=buttons
-        )
+        return status_message, self._STATUS_BUTTONS[self.trader.auto_trade_enabled]
     
     async def _handle_settings(self, event):
         """
@@ -168,32 +333,30 @@ class TelegramInterface:
         Args:
             event: Telegram event
         """
-        settings_message = (
-            "⚙️ **Current Settings:**\n\n"
-            f"🔹 Auto-Trading: **{'Enabled' if self.trader.auto_trade_enabled else 'Disabled'}**\n"
-            f"🔹 Buy Amount: **{self.trader.buy_amount} SOL**\n"
-            f"🔹 Target Multiplier: **{self.trader.target_multiplier}x**\n"
-            f"🔹 Sell Percentage: **{self.trader.sell_percentage}%**\n"
-        )
+        settings_message, buttons = self._render_settings()
         
-        # Add buttons
-        buttons = [
-            [
-                Button.inline("Set Buy Amount", data="set_buy"),
-                Button.inline("Set Target", data="set_target")
-            ],
-            [
-                Button.inline("Set Sell %", data="set_sell"),
-                Button.inline("Toggle Auto-Trade", data="toggle_auto_trade")
-            ]
-        ]
-        
-        await self.bot.client.send_message(
+        await self._send(
             event.chat_id,
             settings_message,
             buttons=buttons
         )
     
+    def _render_settings(self) -> Tuple[str, List]:
+        """
+        Build the settings panel.
+        
+        Returns:
+            Tuple[str, List]: Settings message and its inline keyboard
+        """
+        settings_message = SETTINGS_TEMPLATE.format(
+            auto_trade="Enabled" if self.trader.auto_trade_enabled else "Disabled",
+            buy_amount=self.trader.buy_amount,
+            target_multiplier=self.trader.target_multiplier,
+            sell_percentage=self.trader.sell_percentage
+        )
+        
+        return settings_message, self._SETTINGS_BUTTONS
+    
     async def _handle_trades(self, event):
         """
         Handle /trades command.
@@ -201,29 +364,32 @@ class TelegramInterface:
         Args:
             event: Telegram event
         """
+        await self._send(
+            event.chat_id,
+            self._render_trades()
+        )
+    
+    def _render_trades(self) -> str:
+        """
+        Build the active trades listing.
+        
+        Returns:
+            str: Trades message
+        """
         active_trades = self.trader.get_active_trades()
         
         if not active_trades:
-            await self.bot.client.send_message(
-                event.chat_id,
-                "📈 **Active Trades:**\n\nNo active trades at the moment."
-            )
-            return
-        
-        trades_message = "📈 **Active Trades:**\n\n"
-        
-        for i, trade in enumerate(active_trades, 1):
-            trades_message += (
-                f"**{i}. {trade['symbol']}**\n"
-                f"🔹 Amount: {trade['amount']:.4f}\n"
-                f"🔹 Current Value: {trade['current_value']:.4f} SOL\n"
-                f"🔹 Profit: {trade['profit_percentage']:.2f}%\n\n"
-            )
-        
-        await self.bot.client.send_message(
-            event.chat_id,
-            trades_message
+            return "📈 **Active Trades:**\n\nNo active trades at the moment."
+        
+        parts = ["📈 **Active Trades:**\n\n"]
+        parts.extend(
+            f"**{i}. {trade['symbol']}**\n"
+            f"🔹 Amount: {trade['amount']:.4f}\n"
+            f"🔹 Current Value: {trade['current_value']:.4f} SOL\n"
+            f"🔹 Profit: {trade['profit_percentage']:.2f}%\n\n"
+            for i, trade in enumerate(active_trades, 1)
         )
+        return "".join(parts)
     
     async def _handle_enable(self, event):
         """
@@ -234,7 +400,7 @@ class TelegramInterface:
         """
         self.trader.set_auto_trade_enabled(True)
         
-        await self.bot.client.send_message(
+        await self._send(
             event.chat_id,
             "✅ Auto-trading has been **enabled**."
         )
@@ -248,7 +414,7 @@ class TelegramInterface:
         """
         self.trader.set_auto_trade_enabled(False)
         
-        await self.bot.client.send_message(
+        await self._send(
             event.chat_id,
             "❌ Auto-trading has been **disabled**."
         )
@@ -262,19 +428,19 @@ class TelegramInterface:
         """
         try:
             # Extract amount from command
-            command = event.raw_text.split()
+            argument = event.pattern_match.group(2)
             
-            if len(command) < 2:
-                await self.bot.client.send_message(
+            if argument is None:
+                await self._send(
                     event.chat_id,
                     "❌ Please specify an amount: /setbuy <amount>"
                 )
                 return
             
-            amount = float(command[1])
+            amount = float(argument)
             
             if amount <= 0:
-                await self.bot.client.send_message(
+                await self._send(
                     event.chat_id,
                     "❌ Amount must be greater than 0."
                 )
@@ -282,20 +448,14 @@ class TelegramInterface:
             
             self.trader.set_buy_amount(amount)
             
-            await self.bot.client.send_message(
+            await self._send(
                 event.chat_id,
                 f"✅ Buy amount set to **{amount} SOL**."
             )
         
-        except ValueError:
-            await self.bot.client.send_message(
-                event.chat_id,
-                "❌ Invalid amount. Please specify a valid number."
-            )
-        
         except Exception as e:
             logger.error(f"Error handling setbuy command: {str(e)}")
-            await self.bot.client.send_message(
+            await self._send(
                 event.chat_id,
                 "❌ An error occurred while setting buy amount."
             )
@@ -309,19 +469,19 @@ class TelegramInterface:
         """
         try:
             # Extract multiplier from command
-            command = event.raw_text.split()
+            argument = event.pattern_match.group(2)
             
-            if len(command) < 2:
-                await self.bot.client.send_message(
+            if argument is None:
+                await self._send(
                     event.chat_id,
                     "❌ Please specify a multiplier: /settarget <multiplier>"
                 )
                 return
             
-            multiplier = float(command[1])
+            multiplier = float(argument)
             
             if multiplier <= 1:
-                await self.bot.client.send_message(
+                await self._send(
                     event.chat_id,
                     "❌ Multiplier must be greater than 1."
                 )
@@ -329,20 +489,14 @@ class TelegramInterface:
             
             self.trader.set_target_multiplier(multiplier)
             
-            await self.bot.client.send_message(
+            await self._send(
                 event.chat_id,
                 f"✅ Target multiplier set to **{multiplier}x**."
             )
         
-        except ValueError:
-            await self.bot.client.send_message(
-                event.chat_id,
-                "❌ Invalid multiplier. Please specify a valid number."
-            )
-        
         except Exception as e:
             logger.error(f"Error handling settarget command: {str(e)}")
-            await self.bot.client.send_message(
+            await self._send(
                 event.chat_id,
                 "❌ An error occurred while setting target multiplier."
             )
@@ -356,19 +510,19 @@ class TelegramInterface:
         """
         try:
             # Extract percentage from command
-            command = event.raw_text.split()
+            argument = event.pattern_match.group(2)
             
-            if len(command) < 2:
-                await self.bot.client.send_message(
+            if argument is None:
+                await self._send(
                     event.chat_id,
                     "❌ Please specify a percentage: /setsell <percentage>"
                 )
                 return
             
-            percentage = float(command[1])
+            percentage = float(argument)
             
             if percentage <= 0 or percentage > 100:
-                await self.bot.client.send_message(
+                await self._send(
                     event.chat_id,
                     "❌ Percentage must be between 0 and 100."
                 )
@@ -376,20 +530,14 @@ class TelegramInterface:
             
             self.trader.set_sell_percentage(percentage)
             
-            await self.bot.client.send_message(
+            await self._send(
                 event.chat_id,
                 f"✅ Sell percentage set to **{percentage}%**."
             )
         
-        except ValueError:
-            await self.bot.client.send_message(
-                event.chat_id,
-                "❌ Invalid percentage. Please specify a valid number."
-            )
-        
         except Exception as e:
             logger.error(f"Error handling setsell command: {str(e)}")
-            await self.bot.client.send_message(
+            await self._send(
                 event.chat_id,
                 "❌ An error occurred while setting sell percentage."
             )
@@ -402,72 +550,32 @@ class TelegramInterface:
             event: Telegram event
         """
         try:
-            # Get button data
-            data = event.data.decode("utf-8")
-            
-            if data == "toggle_auto_trade":
-                # Toggle auto-trade
-                new_state = not self.trader.auto_trade_enabled
-                self.trader.set_auto_trade_enabled(new_state)
-                
-                await event.answer(f"Auto-trading {'enabled' if new_state else 'disabled'}")
-                
-                # Update message
-                await self._handle_status(event)
-            
-            elif data == "view_settings":
-                # Show settings
-                await self._handle_settings(event)
-            
-            elif data == "view_trades":
-                # Show trades
-                await self._handle_trades(event)
+            data = event.data
             
-            elif data == "set_buy":
-                # Prompt for buy amount
-                await self.bot.client.send_message(
-                    event.chat_id,
-                    "Please enter buy amount in SOL using /setbuy <amount>"
-                )
-            
-            elif data == "set_target":
-                # Prompt for target multiplier
-                await self.bot.client.send_message(
-                    event.chat_id,
-                    "Please enter target multiplier using /settarget <multiplier>"
-                )
+            # Fixed buttons dispatch on their raw bytes, without decoding
+            handler = self._CALLBACKS.get(data)
+            if handler:
+                await getattr(self, handler)(event)
+                return
             
-            elif data == "set_sell":
-                # Prompt for sell percentage
-                await self.bot.client.send_message(
-                    event.chat_id,
-                    "Please enter sell percentage using /setsell <percentage>"
-                )
+            # Trade buttons carry a binary id issued by the bot client
+            token = self.bot.resolve_trade_button(data)
             
-            elif data.startswith("trade_"):
+            if token:
                 # Handle token trade button
-                token_data = data.split("_")[1:]
-                if len(token_data) >= 2:
-                    symbol = token_data[0]
-                    address = token_data[1]
-                    
-                    # Buy token
-                    success = await self.trader.buy_token(symbol, address)
-                    
-                    if success:
-                        await event.answer(f"Started trading {symbol}")
-                        await self.bot.client.send_message(
-                            event.chat_id,
-                            f"✅ Successfully started trading **{symbol}**."
-                        )
-                    else:
-                        await event.answer(f"Failed to trade {symbol}")
-                        await self.bot.client.send_message(
-                            event.chat_id,
-                            f"❌ Failed to start trading **{symbol}**."
-                        )
+                symbol, address = token
+                
+                # Buy token
+                success = await self.trader.buy_token(symbol, address)
+                
+                if success:
+                    await event.answer(f"Started trading {symbol}")
+                    reply = f"✅ Successfully started trading **{symbol}**."
                 else:
-                    await event.answer("Invalid token data")
+                    await event.answer(f"Failed to trade {symbol}")
+                    reply = f"❌ Failed to start trading **{symbol}**."
+                
+                await self._send(event.chat_id, reply)
             
             else:
                 await event.answer("Unknown button")
@@ -477,7 +585,69 @@ class TelegramInterface:
             logger.error(f"An unexpected error occurred: {str(e)}")
             
             # Optionally, send a message to the user (if this block is part of an async method)
-            await self.bot.client.send_message(
+            await self._send(
                 event.chat_id,
                 "❌ An error occurred while processing your request. Please try again later."
             )
+    
+    async def _cb_toggle(self, event):
+        """
+        Toggle auto-trading from an inline button.
+        
+        Args:
+            event: Telegram callback event
+        """
+        new_state = not self.trader.auto_trade_enabled
+        self.trader.set_auto_trade_enabled(new_state)
+        
+        await event.answer(f"Auto-trading {'enabled' if new_state else 'disabled'}")
+        
+        # Redraw the pressed panel in place; each panel's toggle has its own data
+        if event.data == b"toggle_auto_trade_settings":
+            await self._cb_view_settings(event)
+        else:
+            await self._cb_view_status(event)
+    
+    async def _cb_view_status(self, event):
+        """
+        Show the status panel in place of the pressed panel.
+        
+        Args:
+            event: Telegram callback event
+        """
+        # Any cached balance is good enough for a redraw
+        sol_balance = await self._get_sol_balance(max_age=None)
+        status_message, buttons = self._render_status(sol_balance)
+        await event.edit(status_message, buttons=buttons)
+    
+    async def _cb_view_settings(self, event):
+        """
+        Show settings in place of the status panel.
+        
+        Args:
+            event: Telegram callback event
+        """
+        settings_message, buttons = self._render_settings()
+        await event.edit(settings_message, buttons=buttons)
+    
+    async def _cb_view_trades(self, event):
+        """
+        Show trades in place of the status panel, unless the listing outgrew a single message.
+        
+        Args:
+            event: Telegram callback event
+        """
+        trades_message = self._render_trades()
+        if len(trades_message) <= MAX_MESSAGE_LENGTH:
+            await event.edit(trades_message, buttons=self._TRADES_BUTTONS)
+        else:
+            await self._handle_trades(event)
+    
+    async def _cb_prompt(self, event):
+        """
+        Reply with usage for the setting behind a "Set ..." button.
+        
+        Args:
+            event: Telegram callback event
+        """
+        await self._send(event.chat_id, self._PROMPTS[event.data])
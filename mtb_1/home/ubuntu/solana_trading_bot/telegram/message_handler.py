@@ -4,11 +4,36 @@ This module handles monitoring and processing messages from Telegram groups.
 """
 import re
 import asyncio
-from typing import Callable, Dict, List, Optional, Set
-from telethon import TelegramClient, events
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, List, Optional, Set
+from telethon import TelegramClient, events, utils
 from telethon.tl.types import Message, PeerChannel, PeerChat, PeerUser
 from loguru import logger
 
+# Token symbol: an uppercase word of 3-10 characters starting with a letter,
+# optionally prefixed with '$', standing on its own (start of text or after whitespace)
+TOKEN_PATTERN = re.compile(r'(?<!\S)\$?[A-Z][A-Z0-9]{2,9}\b')
+
+# Contract address
+ADDRESS_PATTERN = re.compile(r'\b0x[a-fA-F0-9]{40}\b')
+
+# Either of the above, so a message is scanned in a single pass; the matched
+# alternative is reported by the match's lastgroup ('token' or 'address')
+MENTION_PATTERN = re.compile(f'(?P<token>{TOKEN_PATTERN.pattern})|(?P<address>{ADDRESS_PATTERN.pattern})')
+
+# Maximum number of messages scan_recent_messages processes at once
+SCAN_CONCURRENCY = 16
+
+# Maximum number of fetched messages waiting to be scanned
+SCAN_QUEUE_SIZE = 256
+
+# How long a token mentioned in a chat is not reported again for that chat (seconds)
+MENTION_DEDUPE_TTL = 30
+
+# Upper bound on remembered (chat, token) mentions; the oldest entry is evicted beyond this
+MAX_RECENT_MENTIONS = 4096
+
 class TelegramMessageHandler:
     """
     Handler for Telegram messages.
@@ -24,9 +49,12 @@ class TelegramMessageHandler:
         """
         self.client = client
         self.notification_callback = None
-        self.monitored_groups = set()
-        self.token_pattern = re.compile(r'(\$[A-Z0-9]{2,10}|[A-Z0-9]{2,10})')
-        self.address_pattern = re.compile(r'(0x[a-fA-F0-9]{40})')
+        
+        # Replaced rather than mutated, so a reader's snapshot never changes under it
+        self.monitored_groups = frozenset()
+        
+        # (chat_id, symbol) -> time.monotonic() of the last notification, oldest first
+        self._recent_mentions = OrderedDict()
         
         # Setup message handler
         self.client.add_event_handler(
@@ -53,9 +81,19 @@ class TelegramMessageHandler:
         Args:
             group_id: ID of the group to monitor
         """
-        self.monitored_groups.add(group_id)
+        self.monitored_groups = self.monitored_groups | {group_id}
         logger.info(f"Added group {group_id} to monitored groups")
     
+    def add_monitored_groups(self, group_ids: Iterable[int]):
+        """
+        Add several groups to the monitored groups list at once.
+        
+        Args:
+            group_ids: IDs of the groups to monitor
+        """
+        self.monitored_groups = self.monitored_groups.union(group_ids)
+        logger.info(f"Monitoring {len(self.monitored_groups)} groups")
+    
     def remove_monitored_group(self, group_id: int):
         """
         Remove a group from the monitored groups list.
@@ -64,7 +102,7 @@ class TelegramMessageHandler:
             group_id: ID of the group to stop monitoring
         """
         if group_id in self.monitored_groups:
-            self.monitored_groups.remove(group_id)
+            self.monitored_groups = self.monitored_groups - {group_id}
             logger.info(f"Removed group {group_id} from monitored groups")
     
     async def _handle_new_message(self, event):
@@ -82,64 +120,112 @@ class TelegramMessageHandler:
             if not message.text:
                 return
             
-            # Get chat ID
-            chat = await event.get_chat()
-            chat_id = chat.id
+            # Get chat ID from the message's peer; event.chat_id is the marked
+            # form (e.g. -100... for channels) while groups are tracked by bare ID
+            chat_id = utils.resolve_id(event.chat_id)[0]
             
             # Check if this is a monitored group
-            if self.monitored_groups and chat_id not in self.monitored_groups:
+            monitored = self.monitored_groups
+            if monitored and chat_id not in monitored:
                 return
             
-            # Process the message
-            await self._process_message(message, chat)
+            # Process the message; the chat itself is only fetched on a match
+            await self._process_message(message)
         
         except Exception as e:
             logger.error(f"Error handling message: {str(e)}")
     
-    async def _process_message(self, message: Message, chat):
+    async def _process_message(self, message: Message, chat=None):
         """
         Process a message for token mentions.
         
         Args:
             message: Telegram message
-            chat: Chat where the message was sent
+            chat: Chat where the message was sent, fetched from the message if not given
         """
         try:
             # Extract text
             text = message.text
             
-            # Extract potential token symbols
-            tokens = self.token_pattern.findall(text)
-            addresses = self.address_pattern.findall(text)
+            # Extract potential token symbols and contract addresses in one pass
+            tokens = []
+            addresses = []
+            for match in MENTION_PATTERN.finditer(text):
+                if match.lastgroup == 'token':
+                    tokens.append(match.group())
+                else:
+                    addresses.append(match.group())
             
-            # If tokens or addresses found, notify
-            if tokens or addresses:
-                # Get sender info
+            # Nothing to report; no chat or sender lookups on this path
+            if not tokens and not addresses:
+                return
+            
+            # Get chat and sender info, fetching them together when both are needed
+            if chat is None:
+                chat, sender = await asyncio.gather(message.get_chat(), message.get_sender())
+            else:
                 sender = await message.get_sender()
-                sender_name = getattr(sender, 'first_name', 'Unknown')
+            sender_name = getattr(sender, 'first_name', 'Unknown')
+            
+            logger.info(f"Potential token mention in {getattr(chat, 'title', 'Unknown')} from {sender_name}: {tokens or addresses}")
+            
+            # Call notification callback if set
+            callback = self.notification_callback
+            if callback:
+                chat_id = getattr(chat, 'id', None)
                 
-                logger.info(f"Potential token mention in {getattr(chat, 'title', 'Unknown')} from {sender_name}: {tokens or addresses}")
+                # Fields shared by every token in this message
+                address = addresses[0] if addresses else None
+                source = f"Telegram: {getattr(chat, 'title', 'Unknown')}"
                 
-                # Call notification callback if set
-                if self.notification_callback:
-                    for token in tokens:
-                        # Clean token symbol (remove $ if present)
-                        token = token.strip('$')
-                        
-                        # Create token info
-                        token_info = {
-                            'symbol': token,
-                            'address': addresses[0] if addresses else None,
-                            'source': f"Telegram: {getattr(chat, 'title', 'Unknown')}",
-                            'message': text
-                        }
-                        
-                        # Send notification
-                        await self.notification_callback(token_info)
+                for token in tokens:
+                    # Clean token symbol (remove leading $ if present)
+                    token = token.lstrip('$')
+                    
+                    # Skip tokens already reported from this chat moments ago
+                    if self._is_recent_mention(chat_id, token):
+                        continue
+                    
+                    # Create token info
+                    token_info = {
+                        'symbol': token,
+                        'address': address,
+                        'source': source,
+                        'message': text
+                    }
+                    
+                    # Send notification
+                    await callback(token_info)
         
         except Exception as e:
             logger.error(f"Error processing message: {str(e)}")
     
+    def _is_recent_mention(self, chat_id: Optional[int], symbol: str) -> bool:
+        """
+        Check whether a token was reported from a chat within MENTION_DEDUPE_TTL,
+        recording this mention if it was not.
+        
+        Args:
+            chat_id: ID of the chat the token was mentioned in
+            symbol: Token symbol
+        
+        Returns:
+            bool: True if the mention is a recent duplicate, False otherwise
+        """
+        key = (chat_id, symbol)
+        now = time.monotonic()
+        
+        last_seen = self._recent_mentions.get(key)
+        if last_seen is not None and now - last_seen < MENTION_DEDUPE_TTL:
+            return True
+        
+        self._recent_mentions[key] = now
+        self._recent_mentions.move_to_end(key)
+        if len(self._recent_mentions) > MAX_RECENT_MENTIONS:
+            self._recent_mentions.popitem(last=False)
+        
+        return False
+    
     async def scan_recent_messages(self, group_id: int, limit: int = 100):
         """
         Scan recent messages in a group for token mentions.
@@ -154,15 +240,33 @@ class TelegramMessageHandler:
             # Get the group entity
             group = await self.client.get_entity(group_id)
             
-            # Get recent messages
-            messages = await self.client.get_messages(group, limit=limit)
+            # Fetch pages of recent messages while workers scan the ones already
+            # fetched; each may need a sender lookup
+            queue = asyncio.Queue(maxsize=SCAN_QUEUE_SIZE)
+            scanned = 0
+            
+            async def produce():
+                nonlocal scanned
+                try:
+                    async for message in self.client.iter_messages(group, limit=limit):
+                        scanned += 1
+                        if message.text:
+                            await queue.put(message)
+                finally:
+                    # One stop marker per worker
+                    for _ in range(SCAN_CONCURRENCY):
+                        await queue.put(None)
             
-            # Process each message
-            for message in messages:
-                if message.text:
+            async def work():
+                while True:
+                    message = await queue.get()
+                    if message is None:
+                        return
                     await self._process_message(message, group)
             
-            logger.info(f"Scanned {len(messages)} messages in group {getattr(group, 'title', 'Unknown')}")
+            await asyncio.gather(produce(), *(work() for _ in range(SCAN_CONCURRENCY)))
+            
+            logger.info(f"Scanned {scanned} messages in group {getattr(group, 'title', 'Unknown')}")
         
         except Exception as e:
             logger.error(f"Error scanning messages in group {group_id}: {str(e)}")
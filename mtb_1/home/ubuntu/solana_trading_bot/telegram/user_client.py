@@ -10,6 +10,7 @@ from loguru import logger
 
 from telegram.client_factory import TelegramClientFactory
 from telegram.group_manager import TelegramGroupManager
+from telegram.group_store import GroupStore
 from telegram.message_handler import TelegramMessageHandler
 
 class UserClient:
@@ -36,6 +37,7 @@ class UserClient:
         self.message_handler = None
         self.notification_callback = None
         self.running = False
+        self._stop_event = asyncio.Event()  # Set by stop(); run() waits on it
         
         # Session file path
         self.session_file = os.path.join(
@@ -44,14 +46,22 @@ class UserClient:
             "user_session.txt"
         )
         
+        # Joined groups cache file path
+        self.groups_file = os.path.join(
+            os.path.dirname(os.path.dirname(__file__)),
+            "config",
+            "joined_groups.json"
+        )
+        
         logger.info("User client initialized")
     
     async def start(self):
         """Start the user client and connect to Telegram."""
         logger.info("Starting user client...")
+        self._stop_event.clear()
         
         # Load session if exists
-        self.session_string = TelegramClientFactory.load_session(self.session_file)
+        self.session_string = await TelegramClientFactory.load_session(self.session_file)
         
         # Create client
         self.client, self.session_string = await TelegramClientFactory.create_user_client(
@@ -62,10 +72,11 @@ class UserClient:
         )
         
         # Save session
-        TelegramClientFactory.save_session(self.session_string, self.session_file)
+        await TelegramClientFactory.save_session(self.session_string, self.session_file)
         
         # Initialize group manager and message handler
-        self.group_manager = TelegramGroupManager(self.client)
+        self.group_manager = TelegramGroupManager(self.client, store=GroupStore(self.groups_file))
+        await self.group_manager.load_cache()
         self.message_handler = TelegramMessageHandler(self.client)
         
         # Set notification callback for message handler
@@ -82,6 +93,9 @@ class UserClient:
         """Stop the user client and disconnect from Telegram."""
         logger.info("Stopping user client...")
         
+        self.running = False
+        self._stop_event.set()
+        
         if self.client:
             await self.client.disconnect()
         
@@ -95,12 +109,10 @@ class UserClient:
         # Get joined groups and add them to monitored groups
         if self.group_manager and self.message_handler:
             groups = await self.group_manager.get_joined_groups()
-            for group in groups:
-                self.message_handler.add_monitored_group(group['id'])
-                logger.info(f"Monitoring group: {group['title']}")
+            self.message_handler.add_monitored_groups(group.id for group in groups)
         
-        while self.running:
-            await asyncio.sleep(1)
+        # Wait for stop() instead of waking the loop every second
+        await self._stop_event.wait()
     
     def set_notification_callback(self, callback: Callable):
         """
@@ -135,18 +147,47 @@ class UserClient:
         group_info = await self.group_manager.join_group(group_link)
         
         if group_info:
-            # Add to monitored groups
-            if self.message_handler:
-                self.message_handler.add_monitored_group(group_info['id'])
-            
-            # Scan recent messages
-            if self.message_handler:
-                await self.message_handler.scan_recent_messages(group_info['id'])
+            message_handler = self.message_handler
+            if message_handler:
+                # Add to monitored groups
+                message_handler.add_monitored_group(group_info.id)
+                
+                # Scan recent messages
+                await message_handler.scan_recent_messages(group_info.id)
             
             return True
         
         return False
     
+    async def join_groups(self, group_links: List[str]) -> int:
+        """
+        Join several Telegram groups concurrently.
+        
+        Args:
+            group_links: Invite links for the groups
+        
+        Returns:
+            int: Number of groups joined successfully
+        """
+        if not self.group_manager:
+            logger.error("Group manager not initialized")
+            return 0
+        
+        # Join the groups
+        joined = await self.group_manager.join_groups(group_links)
+        
+        if self.message_handler:
+            # Add to monitored groups
+            self.message_handler.add_monitored_groups(group_info.id for group_info in joined)
+            
+            # Scan recent messages
+            await asyncio.gather(
+                *(self.message_handler.scan_recent_messages(group_info.id)
+                  for group_info in joined)
+            )
+        
+        return len(joined)
+    
     async def leave_group(self, group_id: int) -> bool:
         """
         Leave a Telegram group.
@@ -179,4 +220,5 @@ class UserClient:
             logger.error("Group manager not initialized")
             return []
         
-        return await self.group_manager.get_joined_groups()
+        groups = await self.group_manager.get_joined_groups()
+        return [group.to_dict() for group in groups]
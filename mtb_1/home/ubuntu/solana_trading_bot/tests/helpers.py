@@ -0,0 +1,95 @@
+"""
+Shared helpers for the test scripts.
+"""
+import asyncio
+from collections import Counter
+from typing import Optional
+from loguru import logger
+
+# How often a running wait reports its progress (seconds)
+PROGRESS_INTERVAL = 10
+
+async def _report_progress(done: asyncio.Event, timeout: int):
+    """Log the time waited so far every PROGRESS_INTERVAL seconds until done is set."""
+    for elapsed in range(PROGRESS_INTERVAL, timeout, PROGRESS_INTERVAL):
+        await asyncio.sleep(PROGRESS_INTERVAL)
+        if done.is_set():
+            return
+        logger.info(f"Waiting: {elapsed}/{timeout} seconds")
+
+async def ainput(prompt: str) -> str:
+    """
+    Read a line from stdin without blocking the event loop, so client
+    keepalives and other tasks keep running while the user types.
+    
+    Args:
+        prompt: Prompt to show
+    
+    Returns:
+        str: Line entered by the user
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, input, prompt)
+
+async def wait_for_event(done: asyncio.Event, timeout: int) -> bool:
+    """
+    Wait until an event is set or a timeout passes, reporting progress meanwhile.
+    
+    Args:
+        done: Event set by the test once what it waits for has happened
+        timeout: Maximum time to wait in seconds
+    
+    Returns:
+        bool: True if the event was set, False if the timeout passed first
+    """
+    progress = asyncio.create_task(_report_progress(done, timeout))
+    try:
+        await asyncio.wait_for(done.wait(), timeout=timeout)
+        return True
+    except asyncio.TimeoutError:
+        return False
+    finally:
+        progress.cancel()
+
+def result_status(result: Optional[bool]) -> str:
+    """
+    Describe a test result.
+    
+    Args:
+        result: True if the test passed, False if it failed, None if it was skipped
+    
+    Returns:
+        str: PASS, FAIL or SKIPPED
+    """
+    if result is None:
+        return "SKIPPED"
+    return "PASS" if result else "FAIL"
+
+class Results:
+    """
+    Test results by name, with per-status counts kept up to date as results are recorded.
+    """
+    
+    def __init__(self):
+        """Initialize an empty set of results."""
+        # Test name -> result, in the order the tests ran
+        self.results = {}
+        
+        # Status (PASS, FAIL or SKIPPED) -> number of tests
+        self.counts = Counter()
+    
+    def record(self, name: str, result: Optional[bool]):
+        """
+        Record the result of a test.
+        
+        Args:
+            name: Test name
+            result: True if the test passed, False if it failed, None if it was skipped
+        """
+        self.results[name] = result
+        self.counts[result_status(result)] += 1
+    
+    @property
+    def all_passed(self) -> bool:
+        """Whether no recorded test failed; skipped tests do not count as failures."""
+        return self.counts["FAIL"] == 0
@@ -16,17 +16,19 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 # Import bot components
 from utils.config import Config
 from utils.logger import setup_logger
+from utils.event_loop import enable_eager_tasks, install_event_loop_policy
 from telegram.user_client import UserClient
 from telegram.bot_client import BotClient
 from website_monitor.jup_monitor import JupTrenchesMonitor
 from trading.solana_trader import SolanaTrader
+from tests.helpers import Results, ainput, result_status, wait_for_event
 
 async def test_telegram_group_joining(user_client):
     """Test Telegram group joining functionality."""
     print("\n=== Testing Telegram Group Joining ===")
     
     # Test public group joining
-    public_group = input("Enter a public group username to test joining (e.g., 'solana'): ")
+    public_group = await ainput("Enter a public group username to test joining (e.g., 'solana'): ")
     if public_group:
         print(f"Attempting to join public group: {public_group}")
         try:
@@ -36,7 +38,7 @@ async def test_telegram_group_joining(user_client):
             print(f"Error joining public group: {str(e)}")
     
     # Test private group joining
-    private_group = input("Enter a private group invite link to test joining (or press Enter to skip): ")
+    private_group = await ainput("Enter a private group invite link to test joining (or press Enter to skip): ")
     if private_group:
         print(f"Attempting to join private group: {private_group}")
         try:
@@ -58,20 +60,22 @@ async def test_website_monitoring(jup_monitor):
     print("Starting website monitor...")
     jup_monitor.start()
     
-    # Set a test callback
+    # Set a test callback; it runs on the monitor's thread, so the event is set
+    # through this loop
+    loop = asyncio.get_running_loop()
+    done = asyncio.Event()
+    
     async def test_callback(token_data):
         print(f"Token detected: {token_data['symbol']} ({token_data['address']})")
+        loop.call_soon_threadsafe(done.set)
     
     jup_monitor.set_notification_callback(test_callback)
     
-    print("Monitoring jup.ag/trenches for 60 seconds...")
+    print("Monitoring jup.ag/trenches for up to 60 seconds...")
     print("This will test if the website loads correctly and tokens can be extracted.")
     
-    # Wait for a minute to see if any tokens are detected
-    for i in range(60):
-        await asyncio.sleep(1)
-        sys.stdout.write(f"\rWaiting: {i+1}/60 seconds")
-        sys.stdout.flush()
+    # Wait until a token is detected, for at most a minute
+    await wait_for_event(done, 60)
     
     print("\nStopping website monitor...")
     jup_monitor.stop()
@@ -116,6 +120,9 @@ async def test_trading_logic(trader):
 
 async def main():
     """Main function to run the tests."""
+    # Run with the same task factory as main.py
+    enable_eager_tasks()
+    
     # Parse command line arguments
     parser = argparse.ArgumentParser(description="Solana Trading Bot Tests")
     parser.add_argument("--config", type=str, default=".env", help="Path to config file")
@@ -141,6 +148,9 @@ async def main():
         jup_monitor = None
         trader = None
         
+        # Client startups hit independent endpoints, so they run together
+        startup = []
+        
         if args.test in ["all", "telegram", "bot"]:
             # Initialize Telegram clients
             user_client = UserClient(
@@ -148,17 +158,17 @@ async def main():
                 api_hash=config.user_api_hash,
                 phone=config.user_phone
             )
-            
-            await user_client.start()
+            startup.append(user_client.start())
             
             if args.test in ["all", "bot"]:
                 bot_client = BotClient(
                     token=config.bot_token,
                     admin_id=config.admin_id,
+                    api_id=config.user_api_id,
+                    api_hash=config.user_api_hash,
                     user_client=user_client
                 )
-                
-                await bot_client.start()
+                startup.append(bot_client.start())
         
         if args.test in ["all", "website"]:
             # Initialize website monitor
@@ -178,28 +188,30 @@ async def main():
                 auto_trade_enabled=False  # Disable auto-trading for tests
             )
         
+        await asyncio.gather(*startup)
+        
         # Run selected tests
-        results = {}
+        results = Results()
         
         if args.test in ["all", "telegram"] and user_client:
-            results["telegram"] = await test_telegram_group_joining(user_client)
+            results.record("telegram", await test_telegram_group_joining(user_client))
         
         if args.test in ["all", "website"] and jup_monitor:
-            results["website"] = await test_website_monitoring(jup_monitor)
+            results.record("website", await test_website_monitoring(jup_monitor))
         
         if args.test in ["all", "bot"] and bot_client:
-            results["bot"] = await test_bot_interface(bot_client)
+            results.record("bot", await test_bot_interface(bot_client))
         
         if args.test in ["all", "trading"] and trader:
-            results["trading"] = await test_trading_logic(trader)
+            results.record("trading", await test_trading_logic(trader))
         
         # Print summary
         print("\n=== Test Summary ===")
-        for test, result in results.items():
-            print(f"{test.capitalize()}: {'PASS' if result else 'FAIL'}")
+        for test, result in results.results.items():
+            print(f"{test.capitalize()}: {result_status(result)}")
         
-        # Check if all tests passed
-        all_passed = all(results.values())
+        # Check if all tests passed; unlike the other scripts, a skipped test fails the run
+        all_passed = results.counts["PASS"] == len(results.results)
         print(f"\nOverall: {'PASS' if all_passed else 'FAIL'}")
     
     except Exception as e:
@@ -208,16 +220,19 @@ async def main():
     
     finally:
         # Cleanup
-        if user_client:
-            await user_client.stop()
-        
-        if bot_client:
-            await bot_client.stop()
+        await asyncio.gather(
+            *(client.stop() for client in (user_client, bot_client) if client),
+            return_exceptions=True
+        )
         
         if jup_monitor:
             jup_monitor.stop()
         
+        if trader:
+            await trader.close()
+        
         logger.info("Tests completed")
 
 if __name__ == "__main__":
+    install_event_loop_policy()
     asyncio.run(main())
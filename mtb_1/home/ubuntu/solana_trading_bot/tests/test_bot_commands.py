@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Test script for the bot's /status and setter commands.
+This script runs BotClient command handlers against stub components, without network access.
+"""
+import os
+import sys
+import asyncio
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Import bot components
+from telegram.bot_client import COMMAND_PATTERN, BotClient
+from tests.helpers import Results, result_status
+
+ADMIN_ID = 1
+
+class StubTelegramClient:
+    """Telegram client that records sent messages instead of sending them."""
+    
+    def __init__(self):
+        self.sent = []
+    
+    def on(self, event):
+        return lambda handler: handler
+    
+    async def send_message(self, entity, text, buttons=None, link_preview=False):
+        self.sent.append((entity, text))
+
+class StubWallet:
+    async def get_sol_balance(self) -> float:
+        return 1.5
+
+class StubTrader:
+    def __init__(self):
+        self.wallet = StubWallet()
+        self.active_trades = {"ABC": object()}
+        self.auto_trade_enabled = True
+        self.buy_amount = None
+    
+    def set_buy_amount(self, amount: float):
+        self.buy_amount = amount
+
+class StubEntity:
+    def __init__(self, title):
+        self.title = title
+
+class StubDialog:
+    def __init__(self, title):
+        self.entity = StubEntity(title)
+
+class StubUserClient:
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+    
+    async def get_dialogs(self):
+        if self.fail:
+            raise ConnectionError("dialogs unavailable")
+        return [StubDialog("Group A"), StubDialog("Group B"), StubDialog(None)]
+
+class StubEvent:
+    chat_id = ADMIN_ID
+    
+    def __init__(self, text: str = "/status"):
+        self.pattern_match = COMMAND_PATTERN.match(text)
+
+async def run_command(handler_name: str, text: str, user_client=None, trader=None) -> str:
+    """Run one BotClient command handler and return the text it sent."""
+    client = StubTelegramClient()
+    bot = BotClient(token="test", admin_id=ADMIN_ID, user_client=user_client, client=client)
+    bot.trader = trader
+    
+    await getattr(bot, handler_name)(StubEvent(text))
+    
+    assert len(client.sent) == 1, f"expected one reply, got {len(client.sent)}"
+    return client.sent[0][1]
+
+async def run_status(user_client, trader=None) -> str:
+    """Run handle_status once and return the text it sent."""
+    return await run_command("handle_status", "/status", user_client, trader)
+
+async def test_status_reply() -> bool:
+    """Test /status reports balance, trades and groups count."""
+    print("\n=== Testing /status ===")
+    try:
+        text = await run_status(StubUserClient(), StubTrader())
+        print(text)
+        return ("1.5000 SOL" in text and "Active Trades: **1**" in text
+                and "**2 Telegram groups**" in text and "Enabled" in text)
+    except Exception as e:
+        print(f"Error running /status: {str(e)}")
+        return False
+
+async def test_status_groups_failure() -> bool:
+    """Test /status still reports the balance when the groups count fails."""
+    print("\n=== Testing /status with failing dialogs fetch ===")
+    try:
+        text = await run_status(StubUserClient(fail=True), StubTrader())
+        print(text)
+        return "1.5000 SOL" in text and "**? Telegram groups**" in text
+    except Exception as e:
+        print(f"Error running /status: {str(e)}")
+        return False
+
+async def test_status_without_trader() -> bool:
+    """Test /status replies with an error when no trader is set."""
+    print("\n=== Testing /status without trader ===")
+    try:
+        text = await run_status(StubUserClient())
+        print(text)
+        return "Trader component not initialized" in text
+    except Exception as e:
+        print(f"Error running /status: {str(e)}")
+        return False
+
+async def test_set_buy() -> bool:
+    """Test /setbuy replies with usage on a missing or non-numeric amount and sets a valid one."""
+    print("\n=== Testing /setbuy ===")
+    try:
+        for text in ("/setbuy", "/setbuy abc"):
+            trader = StubTrader()
+            reply = await run_command("handle_set_buy", text, trader=trader)
+            print(f"{text}: {reply}")
+            if "/setbuy <amount>" not in reply or trader.buy_amount is not None:
+                return False
+        
+        trader = StubTrader()
+        reply = await run_command("handle_set_buy", "/setbuy 0.5", trader=trader)
+        print(f"/setbuy 0.5: {reply}")
+        return trader.buy_amount == 0.5
+    except Exception as e:
+        print(f"Error running /setbuy: {str(e)}")
+        return False
+
+async def main() -> bool:
+    """Main function to run the tests."""
+    results = Results()
+    results.record("status_reply", await test_status_reply())
+    results.record("status_groups_failure", await test_status_groups_failure())
+    results.record("status_without_trader", await test_status_without_trader())
+    results.record("set_buy", await test_set_buy())
+    
+    # Print summary
+    print("\n=== Test Summary ===")
+    for test, result in results.results.items():
+        print(f"{test.replace('_', ' ').title()}: {result_status(result)}")
+    
+    all_passed = results.all_passed
+    print(f"\nOverall: {'PASS' if all_passed else 'FAIL'}")
+    return all_passed
+
+if __name__ == "__main__":
+    sys.exit(0 if asyncio.run(main()) else 1)
@@ -8,6 +8,7 @@ import sys
 import asyncio
 import argparse
 from dotenv import load_dotenv
+from telethon import events
 from loguru import logger
 
 # Add project root to path
@@ -16,14 +17,18 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 # Import bot components
 from utils.config import Config
 from utils.logger import setup_logger
+from utils.event_loop import enable_eager_tasks, install_event_loop_policy
 from telegram.user_client import UserClient
-from telegram.group_manager import GroupManager
+from tests.helpers import Results, ainput, result_status, wait_for_event
+
+# Maximum number of groups offered for the message monitoring test
+MAX_LISTED_GROUPS = 20
 
 async def test_public_group_joining(user_client, group_manager):
     """Test joining a public Telegram group."""
     print("\n=== Testing Public Group Joining ===")
     
-    public_group = input("Enter a public group username to test joining (e.g., 'solana'): ")
+    public_group = await ainput("Enter a public group username to test joining (e.g., 'solana'): ")
     if not public_group:
         print("Skipping public group test.")
         return None
@@ -47,7 +52,7 @@ async def test_private_group_joining(user_client, group_manager):
     """Test joining a private Telegram group via invite link."""
     print("\n=== Testing Private Group Joining ===")
     
-    private_group = input("Enter a private group invite link to test joining (or press Enter to skip): ")
+    private_group = await ainput("Enter a private group invite link to test joining (or press Enter to skip): ")
     if not private_group:
         print("Skipping private group test.")
         return None
@@ -71,9 +76,15 @@ async def test_group_message_monitoring(user_client, group_manager):
     """Test monitoring messages in joined groups."""
     print("\n=== Testing Group Message Monitoring ===")
     
-    # Get list of joined groups
-    groups = await user_client.get_dialogs()
-    group_list = [g.entity.username or g.entity.title for g in groups if hasattr(g.entity, 'title') and g.entity.title]
+    # Get list of joined groups, streaming dialogs until enough are listed
+    groups = []
+    async for dialog in user_client.client.iter_dialogs():
+        if getattr(dialog.entity, 'title', None):
+            groups.append(dialog.entity)
+            if len(groups) >= MAX_LISTED_GROUPS:
+                break
+    
+    group_list = [getattr(g, 'username', None) or g.title for g in groups]
     
     if not group_list:
         print("No groups found to monitor. Please join groups first.")
@@ -84,7 +95,7 @@ async def test_group_message_monitoring(user_client, group_manager):
         print(f"{i+1}. {group}")
     
     # Select a group to monitor
-    selection = input(f"Enter group number to monitor (1-{len(group_list)}) or press Enter to skip: ")
+    selection = await ainput(f"Enter group number to monitor (1-{len(group_list)}) or press Enter to skip: ")
     if not selection:
         print("Skipping message monitoring test.")
         return None
@@ -99,25 +110,25 @@ async def test_group_message_monitoring(user_client, group_manager):
         print(f"Monitoring messages in: {selected_group}")
         
         # Set up a test message handler
+        done = asyncio.Event()
+        
         async def test_message_handler(event):
             sender = await event.get_sender()
             sender_name = getattr(sender, 'username', None) or getattr(sender, 'first_name', 'Unknown')
             print(f"Message from {sender_name}: {event.text}")
+            done.set()
         
         # Start monitoring
-        user_client.add_event_handler(test_message_handler)
+        user_client.client.add_event_handler(test_message_handler, events.NewMessage(chats=groups[index]))
         
-        print("Monitoring messages for 60 seconds...")
+        print("Monitoring messages for up to 60 seconds...")
         print("Send messages to the selected group to test monitoring.")
         
-        # Wait for a minute
-        for i in range(60):
-            await asyncio.sleep(1)
-            sys.stdout.write(f"\rWaiting: {i+1}/60 seconds")
-            sys.stdout.flush()
+        # Wait until a message arrives, for at most a minute
+        await wait_for_event(done, 60)
         
         # Remove the handler
-        user_client.remove_event_handler(test_message_handler)
+        user_client.client.remove_event_handler(test_message_handler)
         print("\nMessage monitoring test completed.")
         
         return True
@@ -127,6 +138,9 @@ async def test_group_message_monitoring(user_client, group_manager):
 
 async def main():
     """Main function to run the tests."""
+    # Run with the same task factory as main.py
+    enable_eager_tasks()
+    
     # Parse command line arguments
     parser = argparse.ArgumentParser(description="Telegram Group Joining Tests")
     parser.add_argument("--config", type=str, default=".env", help="Path to config file")
@@ -155,32 +169,28 @@ async def main():
         await user_client.start()
         logger.info("User client started successfully")
         
-        # Initialize group manager
-        group_manager = GroupManager(user_client)
+        # Reuse the user client's group manager so both share one connection
+        group_manager = user_client.group_manager
         
         # Run tests
-        results = {}
+        results = Results()
         
         # Test public group joining
-        results["public_group"] = await test_public_group_joining(user_client, group_manager)
+        results.record("public_group", await test_public_group_joining(user_client, group_manager))
         
         # Test private group joining
-        results["private_group"] = await test_private_group_joining(user_client, group_manager)
+        results.record("private_group", await test_private_group_joining(user_client, group_manager))
         
         # Test message monitoring
-        results["message_monitoring"] = await test_group_message_monitoring(user_client, group_manager)
+        results.record("message_monitoring", await test_group_message_monitoring(user_client, group_manager))
         
         # Print summary
         print("\n=== Test Summary ===")
-        for test, result in results.items():
-            if result is None:
-                status = "SKIPPED"
-            else:
-                status = "PASS" if result else "FAIL"
-            print(f"{test.replace('_', ' ').title()}: {status}")
+        for test, result in results.results.items():
+            print(f"{test.replace('_', ' ').title()}: {result_status(result)}")
         
         # Check if all tests passed
-        all_passed = all(result is True or result is None for result in results.values())
+        all_passed = results.all_passed
         print(f"\nOverall: {'PASS' if all_passed else 'FAIL'}")
     
     except Exception as e:
@@ -195,4 +205,5 @@ async def main():
         logger.info("Tests completed")
 
 if __name__ == "__main__":
+    install_event_loop_policy()
     asyncio.run(main())
@@ -7,6 +7,7 @@ import os
 import sys
 import asyncio
 import argparse
+from contextlib import asynccontextmanager
 from dotenv import load_dotenv
 from loguru import logger
 
@@ -16,41 +17,49 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 # Import bot components
 from utils.config import Config
 from utils.logger import setup_logger
+from utils.event_loop import enable_eager_tasks, install_event_loop_policy
 from website_monitor.jup_monitor import JupTrenchesMonitor
 from website_monitor.token_model import Token
+from tests.helpers import Results, result_status, wait_for_event
+
+@asynccontextmanager
+async def _shared_browser(jup_monitor):
+    """Start the monitor's browser once for all the tests run inside the block."""
+    print("Initializing browser...")
+    await jup_monitor.initialize_browser()
+    print("Browser initialized successfully")
+    try:
+        yield
+    finally:
+        await jup_monitor.close_browser()
 
 async def test_website_loading(jup_monitor):
     """Test if the website loads correctly."""
     print("\n=== Testing Website Loading ===")
     
-    print("Initializing browser and loading jup.ag/trenches...")
+    print("Loading jup.ag/trenches...")
     try:
-        await jup_monitor.initialize_browser()
-        print("Browser initialized successfully")
-        
         await jup_monitor.load_page()
         print("Page loaded successfully")
         
-        # Take a screenshot for verification
-        screenshot_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "logs", "jup_trenches_test.png")
-        os.makedirs(os.path.dirname(screenshot_path), exist_ok=True)
-        
-        await jup_monitor.take_screenshot(screenshot_path)
-        print(f"Screenshot saved to: {screenshot_path}")
+        # Take a screenshot for verification; only meaningful with styles loaded
+        if jup_monitor.full_render:
+            screenshot_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "logs", "jup_trenches_test.png")
+            os.makedirs(os.path.dirname(screenshot_path), exist_ok=True)
+            
+            await jup_monitor.take_screenshot(screenshot_path)
+            print(f"Screenshot saved to: {screenshot_path}")
         
         return True
     except Exception as e:
         print(f"Error loading website: {str(e)}")
         return False
-    finally:
-        await jup_monitor.close_browser()
 
 async def test_token_extraction(jup_monitor):
     """Test if tokens can be extracted from the website."""
     print("\n=== Testing Token Extraction ===")
     
     try:
-        await jup_monitor.initialize_browser()
         await jup_monitor.load_page()
         
         print("Extracting tokens from page...")
@@ -71,8 +80,6 @@ async def test_token_extraction(jup_monitor):
     except Exception as e:
         print(f"Error extracting tokens: {str(e)}")
         return False
-    finally:
-        await jup_monitor.close_browser()
 
 async def test_new_token_detection(jup_monitor):
     """Test if new tokens can be detected."""
@@ -80,20 +87,18 @@ async def test_new_token_detection(jup_monitor):
     
     try:
         # Create a test callback
-        detected_tokens = []
+        detected_symbols = set()
         
         async def test_callback(token_data):
-            detected_tokens.append(token_data)
+            detected_symbols.add(token_data['symbol'])
             print(f"New token detected: {token_data['symbol']} ({token_data['address']})")
         
         jup_monitor.set_notification_callback(test_callback)
         
         # First run to establish baseline
         print("First run to establish baseline of known tokens...")
-        await jup_monitor.initialize_browser()
         await jup_monitor.load_page()
         tokens1 = await jup_monitor.extract_tokens()
-        await jup_monitor.close_browser()
         
         if not tokens1:
             print("No tokens extracted in first run. Cannot continue test.")
@@ -101,6 +106,9 @@ async def test_new_token_detection(jup_monitor):
         
         print(f"Extracted {len(tokens1)} tokens in first run")
         
+        # Seed the monitor's known symbols so only the fake token is new
+        jup_monitor.known_tokens = {token.symbol for token in tokens1}
+        
         # Create a fake "new" token by modifying one from the first batch
         if tokens1:
             # Take the first token and modify it to simulate a new token
@@ -133,7 +141,7 @@ async def test_new_token_detection(jup_monitor):
             jup_monitor.extract_tokens = original_extract
             
             # Check if our fake token was detected
-            detected = any(t['symbol'] == fake_token.symbol for t in detected_tokens)
+            detected = fake_token.symbol in detected_symbols
             print(f"Fake token detection: {'Success' if detected else 'Failed'}")
             
             return detected
@@ -142,36 +150,35 @@ async def test_new_token_detection(jup_monitor):
     except Exception as e:
         print(f"Error in new token detection test: {str(e)}")
         return False
-    finally:
-        await jup_monitor.close_browser()
 
 async def test_continuous_monitoring(jup_monitor):
     """Test continuous monitoring for a short period."""
     print("\n=== Testing Continuous Monitoring ===")
     
     try:
-        # Create a test callback
+        # Create a test callback; it runs on the monitor's thread, so the event
+        # is set through this loop
         detected_tokens = []
+        loop = asyncio.get_running_loop()
+        done = asyncio.Event()
         
         async def test_callback(token_data):
             detected_tokens.append(token_data)
             print(f"New token detected: {token_data['symbol']} ({token_data['address']})")
+            loop.call_soon_threadsafe(done.set)
         
         jup_monitor.set_notification_callback(test_callback)
         
         # Start the monitor
-        print("Starting continuous monitoring for 2 minutes...")
+        print("Starting continuous monitoring for up to 2 minutes...")
         print("This will test if the monitor can run continuously without errors.")
         
         # Set a shorter interval for testing
         jup_monitor.interval = 30  # Check every 30 seconds
         jup_monitor.start()
         
-        # Wait for 2 minutes
-        for i in range(120):
-            await asyncio.sleep(1)
-            sys.stdout.write(f"\rWaiting: {i+1}/120 seconds")
-            sys.stdout.flush()
+        # Wait until a token is detected, for at most 2 minutes
+        await wait_for_event(done, 120)
         
         # Stop the monitor
         print("\nStopping monitor...")
@@ -188,11 +195,16 @@ async def test_continuous_monitoring(jup_monitor):
 
 async def main():
     """Main function to run the tests."""
+    # Run with the same task factory as main.py
+    enable_eager_tasks()
+    
     # Parse command line arguments
     parser = argparse.ArgumentParser(description="Website Monitoring Tests")
     parser.add_argument("--config", type=str, default=".env", help="Path to config file")
     parser.add_argument("--test", type=str, choices=["all", "loading", "extraction", "detection", "monitoring"], 
                         default="all", help="Test to run")
+    parser.add_argument("--full-render", action="store_true",
+                        help="Load images and styles too, e.g. for a usable screenshot")
     args = parser.parse_args()
     
     # Load environment variables
@@ -210,31 +222,36 @@ async def main():
         # Initialize website monitor
         jup_monitor = JupTrenchesMonitor(
             url=config.jup_trenches_url,
-            interval=config.monitoring_interval
+            interval=config.monitoring_interval,
+            full_render=args.full_render
         )
         
         # Run selected tests
-        results = {}
-        
-        if args.test in ["all", "loading"]:
-            results["website_loading"] = await test_website_loading(jup_monitor)
-        
-        if args.test in ["all", "extraction"]:
-            results["token_extraction"] = await test_token_extraction(jup_monitor)
+        results = Results()
         
-        if args.test in ["all", "detection"]:
-            results["new_token_detection"] = await test_new_token_detection(jup_monitor)
+        # The step-by-step tests share one browser launch
+        if args.test in ["all", "loading", "extraction", "detection"]:
+            async with _shared_browser(jup_monitor):
+                if args.test in ["all", "loading"]:
+                    results.record("website_loading", await test_website_loading(jup_monitor))
+                
+                if args.test in ["all", "extraction"]:
+                    results.record("token_extraction", await test_token_extraction(jup_monitor))
+                
+                if args.test in ["all", "detection"]:
+                    results.record("new_token_detection", await test_new_token_detection(jup_monitor))
         
+        # Continuous monitoring starts its own browser on the monitor thread
         if args.test in ["all", "monitoring"]:
-            results["continuous_monitoring"] = await test_continuous_monitoring(jup_monitor)
+            results.record("continuous_monitoring", await test_continuous_monitoring(jup_monitor))
         
         # Print summary
         print("\n=== Test Summary ===")
-        for test, result in results.items():
-            print(f"{test.replace('_', ' ').title()}: {'PASS' if result else 'FAIL'}")
+        for test, result in results.results.items():
+            print(f"{test.replace('_', ' ').title()}: {result_status(result)}")
         
         # Check if all tests passed
-        all_passed = all(results.values())
+        all_passed = results.all_passed
         print(f"\nOverall: {'PASS' if all_passed else 'FAIL'}")
     
     except Exception as e:
@@ -249,4 +266,5 @@ async def main():
         logger.info("Tests completed")
 
 if __name__ == "__main__":
+    install_event_loop_policy()
     asyncio.run(main())
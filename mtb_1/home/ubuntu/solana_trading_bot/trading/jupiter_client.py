@@ -3,22 +3,94 @@ Jupiter API client for Solana trading.
 This module handles interactions with Jupiter Aggregator for token swaps.
 """
 import json
+import time
+import asyncio
 import aiohttp
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 from loguru import logger
 
+try:
+    from orjson import loads as json_loads
+except ImportError:  # Optional; the standard library parser is used instead
+    json_loads = json.loads
+
+# Wrapped SOL mint, used wherever a swap or price is in SOL
+WRAPPED_SOL_MINT = "So11111111111111111111111111111111111111112"
+
+# Spellings callers may use in place of the wrapped SOL mint
+SOL_ALIASES = frozenset({"SOL", "sol", "Sol"})
+
+# Timeout for a single Jupiter API request (seconds)
+REQUEST_TIMEOUT = 10
+
+# Jupiter price API and the most token IDs it accepts per request
+PRICE_API_URL = "https://api.jup.ag/price/v2"
+PRICE_BATCH_SIZE = 100
+
+# How long a fetched token price is reused (seconds)
+PRICE_CACHE_TTL = 5.0
+
+# Jupiter token API; /<mint> returns the token's metadata, including its decimals
+TOKEN_API_URL = "https://tokens.jup.ag/token"
+
 class JupiterClient:
     """
     Client for Jupiter Aggregator API.
     Handles token swaps and price quotes.
     """
     
-    def __init__(self):
-        """Initialize the Jupiter client."""
+    def __init__(
+        self,
+        session: Optional[aiohttp.ClientSession] = None,
+        rpc_url: Optional[str] = None
+    ):
+        """
+        Initialize the Jupiter client.
+        
+        Args:
+            session: Optional shared HTTP session; its pooled connections are
+                reused across requests. The caller owns and closes it. Without
+                one, the client opens its own on first use; release it with close().
+            rpc_url: Optional Solana RPC URL; token decimals are read on-chain
+                through it first, with Jupiter's token API as the fallback
+        """
         self.base_url = "https://quote-api.jup.ag/v6"
-        self.wrapped_sol = "So11111111111111111111111111111111111111112"
+        self.rpc_url = rpc_url
+        self.wrapped_sol = WRAPPED_SOL_MINT
+        self.session = session
+        self._owns_session = False
+        
+        # Mint address -> decimals; a mint's decimals never change
+        self._decimals_cache = {WRAPPED_SOL_MINT: 9}
+        
+        # Mint address -> (price in SOL, time.monotonic() after which it is stale)
+        self._price_cache = {}
+        
         logger.info("Jupiter client initialized")
     
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Get the HTTP session, opening the client's own pooled session if none was given.
+        
+        Returns:
+            aiohttp.ClientSession: Session whose keep-alive connections are reused across calls
+        """
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=100, ttl_dns_cache=300, keepalive_timeout=60),
+                timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+            )
+            self._owns_session = True
+        
+        return self.session
+    
+    async def close(self):
+        """Close the HTTP session if the client opened it; a shared session is left to its owner."""
+        if self._owns_session and self.session is not None:
+            await self.session.close()
+            self.session = None
+            self._owns_session = False
+    
     async def get_quote(
         self,
         input_mint: str,
@@ -40,16 +112,19 @@ class JupiterClient:
         """
         try:
             # Convert SOL to wrapped SOL if needed
-            if input_mint.upper() == "SOL":
-                input_mint = self.wrapped_sol
+            if input_mint in SOL_ALIASES:
+                input_mint = WRAPPED_SOL_MINT
+            
+            if output_mint in SOL_ALIASES:
+                output_mint = WRAPPED_SOL_MINT
             
-            if output_mint.upper() == "SOL":
-                output_mint = self.wrapped_sol
+            # Convert amount to integer (Jupiter expects amounts in the token's smallest unit)
+            decimals = await self._get_decimals(input_mint)
+            if decimals is None:
+                logger.error(f"Could not get decimals for {input_mint}")
+                return None
             
-            # Convert amount to integer (Jupiter expects amounts in lamports/smallest unit)
-            # This is a simplification - in a real implementation, we would need to
-            # get the token's decimals and convert accordingly
-            amount_in_lamports = int(amount * 1_000_000_000)  # Assuming 9 decimals like SOL
+            amount_in_lamports = int(amount * 10 ** decimals)
             
             # Build request URL
             url = f"{self.base_url}/quote"
@@ -60,24 +135,110 @@ class JupiterClient:
                 "slippageBps": slippage_bps
             }
             
-            logger.debug(f"Getting quote: {params}")
+            logger.debug("Getting quote: {}", params)
             
             # Make request
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, params=params) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        logger.error(f"Error getting quote: {response.status} - {error_text}")
-                        return None
-                    
-                    quote = await response.json()
-                    logger.debug(f"Got quote: {quote}")
-                    return quote
+            session = await self._get_session()
+            async with session.get(url, params=params) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    logger.error(f"Error getting quote: {response.status} - {error_text}")
+                    return None
+                
+                quote = json_loads(await response.read())
+                logger.debug("Got quote: {}", quote)
+                return quote
         
         except Exception as e:
             logger.error(f"Error getting swap quote: {str(e)}")
             return None
     
+    async def _get_decimals(self, mint: str) -> Optional[int]:
+        """
+        Get a token's decimals, looking each mint up until it succeeds once.
+        
+        The mint account on-chain is the source of truth and knows a token the
+        moment it launches; Jupiter's token API is only asked if that fails.
+        
+        Args:
+            mint: Token mint address
+        
+        Returns:
+            Optional[int]: Number of decimals or None if every lookup failed
+        """
+        decimals = self._decimals_cache.get(mint)
+        if decimals is not None:
+            return decimals
+        
+        if self.rpc_url:
+            decimals = await self._get_decimals_on_chain(mint)
+        if decimals is None:
+            decimals = await self._get_decimals_from_api(mint)
+        
+        # Failures are not cached, so the next quote tries again
+        if decimals is not None:
+            self._decimals_cache[mint] = decimals
+        return decimals
+    
+    async def _get_decimals_on_chain(self, mint: str) -> Optional[int]:
+        """
+        Read a token's decimals from its mint account with getTokenSupply.
+        
+        Args:
+            mint: Token mint address
+        
+        Returns:
+            Optional[int]: Number of decimals or None if the lookup failed
+        """
+        payload = {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "getTokenSupply",
+            "params": [mint]
+        }
+        
+        try:
+            session = await self._get_session()
+            async with session.post(self.rpc_url, json=payload) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    logger.warning(f"Error getting token supply: {response.status} - {error_text}")
+                    return None
+                
+                data = json_loads(await response.read())
+            
+            return int(data['result']['value']['decimals'])
+        
+        except Exception as e:
+            logger.warning(f"Error getting token decimals on-chain: {str(e)}")
+            return None
+    
+    async def _get_decimals_from_api(self, mint: str) -> Optional[int]:
+        """
+        Get a token's decimals from Jupiter's token API.
+        
+        Args:
+            mint: Token mint address
+        
+        Returns:
+            Optional[int]: Number of decimals or None if the lookup failed
+        """
+        try:
+            session = await self._get_session()
+            async with session.get(f"{TOKEN_API_URL}/{mint}") as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    logger.error(f"Error getting token info: {response.status} - {error_text}")
+                    return None
+                
+                token = json_loads(await response.read())
+            
+            return int(token['decimals'])
+        
+        except Exception as e:
+            logger.error(f"Error getting token decimals: {str(e)}")
+            return None
+    
     async def get_swap_transaction(
         self,
         quote: Dict,
@@ -102,19 +263,19 @@ class JupiterClient:
                 "wrapUnwrapSOL": True
             }
             
-            logger.debug(f"Getting swap transaction: {data}")
+            logger.debug("Getting swap transaction: {}", data)
             
             # Make request
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, json=data) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        logger.error(f"Error getting swap transaction: {response.status} - {error_text}")
-                        return None
-                    
-                    result = await response.json()
-                    logger.debug("Got swap transaction")
-                    return result.get('swapTransaction')
+            session = await self._get_session()
+            async with session.post(url, json=data) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    logger.error(f"Error getting swap transaction: {response.status} - {error_text}")
+                    return None
+                
+                result = json_loads(await response.read())
+                logger.debug("Got swap transaction")
+                return result.get('swapTransaction')
         
         except Exception as e:
             logger.error(f"Error getting swap transaction: {str(e)}")
@@ -130,27 +291,82 @@ class JupiterClient:
         Returns:
             Optional[float]: Token price in SOL or None if failed
         """
-        try:
-            # Use a small amount to get a quote
-            quote = await self.get_quote(
-                token_address,
-                "SOL",
-                1.0  # 1 token unit
-            )
+        prices = await self.get_prices([token_address])
+        return prices.get(token_address)
+    
+    async def get_prices(self, token_addresses: List[str]) -> Dict[str, Optional[float]]:
+        """
+        Get the prices of several tokens in SOL, in one price API request per
+        PRICE_BATCH_SIZE tokens. Prices fetched within PRICE_CACHE_TTL are reused.
+        
+        Args:
+            token_addresses: Token addresses
+        
+        Returns:
+            Dict[str, Optional[float]]: Token price in SOL by address, None for tokens that could not be priced
+        """
+        # Drop duplicates, keeping order
+        token_addresses = list(dict.fromkeys(token_addresses))
+        prices = dict.fromkeys(token_addresses)
+        
+        # Serve fresh cached prices; only the rest go to the API
+        now = time.monotonic()
+        missing = []
+        for address in token_addresses:
+            cached = self._price_cache.get(address)
+            if cached is not None and cached[1] > now:
+                prices[address] = cached[0]
+            else:
+                missing.append(address)
+        
+        batches = [
+            missing[i:i + PRICE_BATCH_SIZE]
+            for i in range(0, len(missing), PRICE_BATCH_SIZE)
+        ]
+        for batch_prices in await asyncio.gather(*(self._fetch_prices(batch) for batch in batches)):
+            prices.update(batch_prices)
             
-            if not quote:
-                return None
+            expires_at = time.monotonic() + PRICE_CACHE_TTL
+            for address, price in batch_prices.items():
+                self._price_cache[address] = (price, expires_at)
+        
+        return prices
+    
+    async def _fetch_prices(self, token_addresses: List[str]) -> Dict[str, float]:
+        """
+        Fetch one batch of token prices in SOL from the price API.
+        
+        Args:
+            token_addresses: At most PRICE_BATCH_SIZE token addresses
+        
+        Returns:
+            Dict[str, float]: Token price in SOL by address, only for tokens that were priced
+        """
+        try:
+            params = {
+                "ids": ",".join(token_addresses),
+                "vsToken": WRAPPED_SOL_MINT
+            }
             
-            # Extract price from quote
-            in_amount = float(quote['inAmount']) / 1_000_000_000  # Convert from lamports
-            out_amount = float(quote['outAmount']) / 1_000_000_000  # Convert from lamports
+            # Make request
+            session = await self._get_session()
+            async with session.get(PRICE_API_URL, params=params) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    logger.error(f"Error getting token prices: {response.status} - {error_text}")
+                    return {}
+                
+                result = json_loads(await response.read())
             
-            # Price in SOL per token
-            price = out_amount / in_amount
+            # Unknown tokens come back as null entries
+            prices = {}
+            for address, entry in (result.get('data') or {}).items():
+                if entry and entry.get('price') is not None:
+                    prices[address] = float(entry['price'])
             
-            logger.debug(f"Price for {token_address}: {price} SOL")
-            return price
+            logger.debug(f"Got prices for {len(prices)}/{len(token_addresses)} tokens")
+            return prices
         
         except Exception as e:
-            logger.error(f"Error getting token price: {str(e)}")
-            return None
+            logger.error(f"Error getting token prices: {str(e)}")
+            return {}
@@ -32,7 +32,8 @@ class SolanaTrader:
         buy_amount: float = 0.1,
         target_multiplier: float = 2.0,
         sell_percentage: float = 80.0,
-        auto_trade_enabled: bool = False
+        auto_trade_enabled: bool = False,
+        http_session = None
     ):
         """
         Initialize the Solana trader.
@@ -44,6 +45,7 @@ class SolanaTrader:
             target_multiplier: Target profit multiplier
             sell_percentage: Percentage of position to sell at target
             auto_trade_enabled: Whether auto-trading is enabled
+            http_session: Optional shared aiohttp session for Jupiter API and token RPC requests
         """
         self.private_key = private_key
         self.rpc_url = rpc_url
@@ -54,7 +56,7 @@ class SolanaTrader:
         
         # Initialize components
         self.wallet = SolanaWallet(private_key, rpc_url)
-        self.jupiter = JupiterClient()
+        self.jupiter = JupiterClient(session=http_session, rpc_url=rpc_url)
         
         # Store active trades
         self.active_trades = {}
@@ -80,6 +82,10 @@ class SolanaTrader:
             self.monitor_thread.cancel()
         logger.info("Trade monitoring stopped successfully")
     
+    async def close(self):
+        """Release the trader's network resources."""
+        await self.jupiter.close()
+    
     async def _monitor_trades(self):
         """Monitor active trades for target price."""
         logger.info("Trade monitoring loop started")
@@ -88,11 +94,17 @@ class SolanaTrader:
             try:
                 # Check each active trade
                 trades_to_remove = []
+                trades = list(self.active_trades.items())
+                
+                # Price all active trades in one batch
+                prices = {}
+                if trades:
+                    prices = await self.jupiter.get_prices([trade.address for _, trade in trades])
                 
-                for symbol, trade in self.active_trades.items():
+                for symbol, trade in trades:
                     try:
                         # Get current price
-                        current_price = await self.jupiter.get_price(trade.address)
+                        current_price = prices.get(trade.address)
                         
                         if current_price is None:
                             logger.warning(f"Could not get price for {symbol}")
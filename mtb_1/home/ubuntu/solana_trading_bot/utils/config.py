@@ -6,7 +6,30 @@ import os
 from typing import List
 
 class Config:
-    """Configuration class for the Solana Trading Bot."""
+    """
+    Configuration class for the Solana Trading Bot.
+    Values are read from the environment once, at construction.
+    """
+    
+    # Fixed attribute set: no per-instance __dict__, slot-based attribute reads
+    __slots__ = (
+        'user_api_id',
+        'user_api_hash',
+        'user_phone',
+        'bot_token',
+        'admin_id',
+        'telegram_groups',
+        'solana_private_key',
+        'solana_rpc_url',
+        'auto_trade_enabled',
+        'buy_amount_sol',
+        'target_multiplier',
+        'sell_percentage',
+        'enable_website_monitor',
+        'jup_trenches_url',
+        'monitoring_interval',
+        'log_level',
+    )
     
     def __init__(self):
         """Initialize configuration from environment variables."""
@@ -33,6 +56,7 @@ class Config:
         self.sell_percentage = float(os.getenv('SELL_PERCENTAGE', '80'))
         
         # Website Monitoring
+        self.enable_website_monitor = os.getenv('ENABLE_WEBSITE_MONITOR', 'true').lower() == 'true'
         self.jup_trenches_url = os.getenv('JUP_TRENCHES_URL', 'https://jup.ag/trenches?tab=trending')
         self.monitoring_interval = int(os.getenv('MONITORING_INTERVAL', '60'))
         
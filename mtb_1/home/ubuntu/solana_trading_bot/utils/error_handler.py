@@ -38,6 +38,9 @@ class ErrorHandler:
             Decorated function
         """
         def decorator(func):
+            # Resolve the log method once per decorated function, not per failure
+            log_method = getattr(logger, log_level.lower())
+            
             @wraps(func)
             async def async_wrapper(*args, **kwargs):
                 try:
@@ -48,7 +51,6 @@ class ErrorHandler:
                     tb_str = ''.join(traceback.format_exception(exc_type, exc_value, exc_traceback))
                     
                     # Log exception
-                    log_method = getattr(logger, log_level.lower())
                     log_method(f"Exception in {func.__name__}: {str(e)}\n{tb_str}")
                     
                     # Notify admin if requested
@@ -73,7 +75,6 @@ class ErrorHandler:
                     tb_str = ''.join(traceback.format_exception(exc_type, exc_value, exc_traceback))
                     
                     # Log exception
-                    log_method = getattr(logger, log_level.lower())
                     log_method(f"Exception in {func.__name__}: {str(e)}\n{tb_str}")
                     
                     # Notify admin if requested (for sync functions, we can't use async notifier)
@@ -115,6 +116,9 @@ class ErrorHandler:
             Decorated function
         """
         def decorator(func):
+            # Resolve the log method once per decorated function, not per failure
+            log_method = getattr(logger, log_level.lower())
+            
             @wraps(func)
             async def async_wrapper(*args, **kwargs):
                 retries = 0
@@ -125,7 +129,6 @@ class ErrorHandler:
                         retries += 1
                         
                         # Log retry attempt
-                        log_method = getattr(logger, log_level.lower())
                         log_method(f"Retry {retries}/{max_retries} for {func.__name__}: {str(e)}")
                         
                         if retries >= max_retries:
@@ -145,7 +148,6 @@ class ErrorHandler:
                         retries += 1
                         
                         # Log retry attempt
-                        log_method = getattr(logger, log_level.lower())
                         log_method(f"Retry {retries}/{max_retries} for {func.__name__}: {str(e)}")
                         
                         if retries >= max_retries:
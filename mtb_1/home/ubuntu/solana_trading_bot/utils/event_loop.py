@@ -0,0 +1,41 @@
+"""
+Event loop utility for the Solana Trading Bot.
+Selects the fastest available asyncio event loop implementation.
+"""
+import asyncio
+from loguru import logger
+
+def install_event_loop_policy() -> bool:
+    """
+    Install uvloop as the asyncio event loop policy if it is available.
+    Must be called before asyncio.run() so that every Telegram client
+    created afterwards runs on the same loop.
+    
+    Returns:
+        bool: True if uvloop was installed, False if the default loop is used
+    """
+    try:
+        import uvloop
+    except ImportError:  # Optional; not available on Windows
+        logger.debug("uvloop not available, using the default asyncio event loop")
+        return False
+    
+    uvloop.install()
+    return True
+
+def enable_eager_tasks() -> bool:
+    """
+    Make the running loop start new tasks eagerly, if supported.
+    A task whose coroutine finishes without suspending then completes inside
+    create_task() instead of waiting for a turn of the loop. Requires
+    Python 3.12+; on older versions this is a no-op.
+    
+    Returns:
+        bool: True if the eager task factory was installed, False otherwise
+    """
+    eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+    if eager_task_factory is None:
+        return False
+    
+    asyncio.get_running_loop().set_task_factory(eager_task_factory)
+    return True
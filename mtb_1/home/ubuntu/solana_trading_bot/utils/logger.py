@@ -33,11 +33,18 @@ def setup_logger(log_level=None):
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     log_file = os.path.join(logs_dir, f"solana_bot_{timestamp}.log")
     
+    # All sinks are enqueued: formatting and file/console I/O happen on a
+    # background worker instead of blocking the event loop. backtrace and
+    # diagnose are off to skip extended frame inspection on exceptions.
+    
     # Configure console logging
     logger.add(
         sys.stderr,
         format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
-        level=log_level
+        level=log_level,
+        enqueue=True,
+        backtrace=False,
+        diagnose=False
     )
     
     # Configure file logging
@@ -47,7 +54,10 @@ def setup_logger(log_level=None):
         retention="1 week",
         compression="zip",
         format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
-        level="DEBUG"  # Always log everything to file
+        level="DEBUG",  # Always log everything to file
+        enqueue=True,
+        backtrace=False,
+        diagnose=False
     )
     
     # Add error log file for critical errors only
@@ -59,7 +69,10 @@ def setup_logger(log_level=None):
         compression="zip",
         format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
         level="ERROR",
-        filter=lambda record: record["level"].name in ["ERROR", "CRITICAL"]
+        filter=lambda record: record["level"].name in ["ERROR", "CRITICAL"],
+        enqueue=True,
+        backtrace=False,
+        diagnose=False
     )
     
     logger.info(f"Logger initialized with level: {log_level}")
@@ -55,6 +55,11 @@ class BaseWebsiteMonitor(ABC):
             self.thread.join(timeout=10)
         logger.info("Website monitor stopped successfully")
     
+    @property
+    def is_running(self) -> bool:
+        """Whether the monitor thread has been started and not stopped."""
+        return self.running
+    
     async def run(self):
         """Run the website monitor in a loop."""
         while self.running:
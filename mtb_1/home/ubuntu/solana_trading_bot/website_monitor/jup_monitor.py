@@ -4,6 +4,7 @@ This module handles monitoring the jup.ag/trenches website for new tokens.
 """
 import os
 import time
+import asyncio
 from typing import Dict, List, Optional
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
@@ -17,24 +18,35 @@ from loguru import logger
 from website_monitor.base_monitor import BaseWebsiteMonitor
 from website_monitor.token_model import Token
 
+# Resources token extraction never needs; blocked unless the page is fully rendered
+BLOCKED_RESOURCE_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf",
+    "*.mp4", "*.webm", "*.mp3",
+    "*.css"
+]
+
 class JupTrenchesMonitor(BaseWebsiteMonitor):
     """
     Monitor for jup.ag/trenches website.
     Uses Selenium to monitor the website for new tokens.
     """
     
-    def __init__(self, url: str, interval: int = 60):
+    def __init__(self, url: str, interval: int = 60, full_render: bool = False):
         """
         Initialize the JupTrenches monitor.
         
         Args:
             url: URL of the jup.ag/trenches website
             interval: Monitoring interval in seconds
+            full_render: Load images, fonts, media and stylesheets too; only
+                needed for meaningful screenshots
         """
         super().__init__(url, interval)
         
         # Selenium WebDriver
         self.driver = None
+        self.full_render = full_render
         
         # Configure Selenium options
         self.options = Options()
@@ -43,6 +55,8 @@ class JupTrenchesMonitor(BaseWebsiteMonitor):
         self.options.add_argument("--disable-dev-shm-usage")
         self.options.add_argument("--disable-gpu")
         self.options.add_argument("--window-size=1920,1080")
+        if not full_render:
+            self.options.add_argument("--blink-settings=imagesEnabled=false")
         
         # Create logs directory if it doesn't exist
         os.makedirs("logs", exist_ok=True)
@@ -55,6 +69,12 @@ class JupTrenchesMonitor(BaseWebsiteMonitor):
             logger.info("Initializing WebDriver...")
             service = Service(ChromeDriverManager().install())
             self.driver = webdriver.Chrome(service=service, options=self.options)
+            
+            # Skip downloading resources that carry no token data
+            if not self.full_render:
+                self.driver.execute_cdp_cmd("Network.enable", {})
+                self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_RESOURCE_PATTERNS})
+            
             logger.info("WebDriver initialized successfully")
         except Exception as e:
             logger.error(f"Error initializing WebDriver: {str(e)}")
@@ -68,6 +88,8 @@ class JupTrenchesMonitor(BaseWebsiteMonitor):
                 logger.info("WebDriver closed")
             except Exception as e:
                 logger.error(f"Error closing WebDriver: {str(e)}")
+            finally:
+                self.driver = None
     
     def _extract_tokens(self) -> List[Token]:
         """
@@ -79,143 +101,216 @@ class JupTrenchesMonitor(BaseWebsiteMonitor):
         tokens = []
         
         try:
-            # Navigate to the website
-            logger.info(f"Navigating to {self.url}")
-            self.driver.get(self.url)
-            
-            # Wait for the page to load
-            logger.info("Waiting for page to load...")
-            WebDriverWait(self.driver, 30).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "table"))
-            )
-            
-            # Wait for the trending table to load
-            logger.info("Waiting for trending table to load...")
-            WebDriverWait(self.driver, 30).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "table tbody tr"))
-            )
-            
+            self._load_page()
+            tokens = self._parse_tokens()
+        
+        except Exception as e:
+            logger.error(f"Error extracting tokens: {str(e)}")
             # Take screenshot for debugging
+            try:
+                screenshot_path = "logs/website_error.png"
+                self.driver.save_screenshot(screenshot_path)
+                logger.info(f"Error screenshot saved to {screenshot_path}")
+            except:
+                pass
+        
+        return tokens
+    
+    def _load_page(self):
+        """Navigate to the website and wait for the trending table to load."""
+        # Navigate to the website
+        logger.info(f"Navigating to {self.url}")
+        self.driver.get(self.url)
+        
+        # Wait for the page to load
+        logger.info("Waiting for page to load...")
+        WebDriverWait(self.driver, 30).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, "table"))
+        )
+        
+        # Wait for the trending table to load
+        logger.info("Waiting for trending table to load...")
+        WebDriverWait(self.driver, 30).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, "table tbody tr"))
+        )
+    
+    def _parse_tokens(self) -> List[Token]:
+        """
+        Read token information from the loaded page.
+        
+        Returns:
+            List of Token objects
+        """
+        tokens = []
+        
+        # Take screenshot for debugging; without styles it would show nothing useful
+        if self.full_render:
             try:
                 screenshot_path = "logs/jup_trenches.png"
                 self.driver.save_screenshot(screenshot_path)
                 logger.debug(f"Screenshot saved to {screenshot_path}")
             except Exception as e:
                 logger.warning(f"Failed to save screenshot: {str(e)}")
-            
-            # Find all rows in the trending table
-            rows = self.driver.find_elements(By.CSS_SELECTOR, "table tbody tr")
-            logger.info(f"Found {len(rows)} rows in the trending table")
-            
-            for row in rows:
+        
+        # Find all rows in the trending table
+        rows = self.driver.find_elements(By.CSS_SELECTOR, "table tbody tr")
+        logger.info(f"Found {len(rows)} rows in the trending table")
+        
+        for row in rows:
+            try:
+                # Extract token information from the row
+                cells = row.find_elements(By.TAG_NAME, "td")
+                
+                if len(cells) < 3:
+                    logger.warning(f"Row has less than 3 cells, skipping")
+                    continue
+                
+                # Extract symbol
                 try:
-                    # Extract token information from the row
-                    cells = row.find_elements(By.TAG_NAME, "td")
-                    
-                    if len(cells) < 3:
-                        logger.warning(f"Row has less than 3 cells, skipping")
-                        continue
-                    
-                    # Extract symbol
-                    try:
-                        symbol_element = cells[0].find_element(By.CSS_SELECTOR, "div[data-testid='token-symbol']")
-                        symbol = symbol_element.text.strip()
-                    except Exception as e:
-                        logger.warning(f"Failed to extract symbol: {str(e)}")
-                        # Try alternative method
-                        try:
-                            symbol = cells[0].text.strip().split('\n')[0]
-                        except:
-                            logger.error("Could not extract symbol using alternative method")
-                            continue
-                    
-                    # Extract address
-                    address = None
+                    symbol_element = cells[0].find_element(By.CSS_SELECTOR, "div[data-testid='token-symbol']")
+                    symbol = symbol_element.text.strip()
+                except Exception as e:
+                    logger.warning(f"Failed to extract symbol: {str(e)}")
+                    # Try alternative method
                     try:
-                        # Try to find the address in the data attribute
-                        address_element = cells[0].find_element(By.CSS_SELECTOR, "div[data-mint]")
-                        address = address_element.get_attribute("data-mint")
+                        symbol = cells[0].text.strip().split('\n')[0]
                     except:
-                        # If not found, try to extract from the link
-                        try:
-                            link_element = cells[0].find_element(By.TAG_NAME, "a")
-                            href = link_element.get_attribute("href")
-                            if "=" in href:
-                                address = href.split("=")[-1]
-                        except:
-                            logger.warning(f"Could not extract address for {symbol}")
-                    
-                    # Extract price
-                    price = None
-                    try:
-                        price_element = cells[1].find_element(By.CSS_SELECTOR, "div")
-                        price_text = price_element.text.strip()
-                        # Remove $ and convert to float
-                        if price_text.startswith("$"):
-                            price = float(price_text[1:].replace(",", ""))
-                    except Exception as e:
-                        logger.warning(f"Failed to extract price: {str(e)}")
-                    
-                    # Extract price change
-                    price_change_24h = None
-                    try:
-                        if len(cells) > 2:
-                            change_element = cells[2].find_element(By.CSS_SELECTOR, "div")
-                            change_text = change_element.text.strip()
-                            # Remove % and convert to float
-                            if "%" in change_text:
-                                change_text = change_text.replace("%", "")
-                                price_change_24h = float(change_text)
-                    except Exception as e:
-                        logger.warning(f"Failed to extract price change: {str(e)}")
-                    
-                    # Extract volume
-                    volume_24h = None
+                        logger.error("Could not extract symbol using alternative method")
+                        continue
+                
+                # Extract address
+                address = None
+                try:
+                    # Try to find the address in the data attribute
+                    address_element = cells[0].find_element(By.CSS_SELECTOR, "div[data-mint]")
+                    address = address_element.get_attribute("data-mint")
+                except:
+                    # If not found, try to extract from the link
                     try:
-                        if len(cells) > 3:
-                            volume_element = cells[3].find_element(By.CSS_SELECTOR, "div")
-                            volume_text = volume_element.text.strip()
-                            # Remove $ and convert to float
-                            if volume_text.startswith("$"):
-                                volume_text = volume_text[1:].replace(",", "")
-                                # Handle K, M, B suffixes
-                                if "K" in volume_text:
-                                    volume_24h = float(volume_text.replace("K", "")) * 1000
-                                elif "M" in volume_text:
-                                    volume_24h = float(volume_text.replace("M", "")) * 1000000
-                                elif "B" in volume_text:
-                                    volume_24h = float(volume_text.replace("B", "")) * 1000000000
-                                else:
-                                    volume_24h = float(volume_text)
-                    except Exception as e:
-                        logger.warning(f"Failed to extract volume: {str(e)}")
-                    
-                    # Create token object
-                    token = Token(
-                        symbol=symbol,
-                        address=address,
-                        price=price,
-                        price_change_24h=price_change_24h,
-                        volume_24h=volume_24h,
-                        source="jup.ag/trenches"
-                    )
-                    
-                    tokens.append(token)
-                    logger.debug(f"Extracted token: {symbol}")
+                        link_element = cells[0].find_element(By.TAG_NAME, "a")
+                        href = link_element.get_attribute("href")
+                        if "=" in href:
+                            address = href.split("=")[-1]
+                    except:
+                        logger.warning(f"Could not extract address for {symbol}")
                 
+                # Extract price
+                price = None
+                try:
+                    price_element = cells[1].find_element(By.CSS_SELECTOR, "div")
+                    price_text = price_element.text.strip()
+                    # Remove $ and convert to float
+                    if price_text.startswith("$"):
+                        price = float(price_text[1:].replace(",", ""))
+                except Exception as e:
+                    logger.warning(f"Failed to extract price: {str(e)}")
+                
+                # Extract price change
+                price_change_24h = None
+                try:
+                    if len(cells) > 2:
+                        change_element = cells[2].find_element(By.CSS_SELECTOR, "div")
+                        change_text = change_element.text.strip()
+                        # Remove % and convert to float
+                        if "%" in change_text:
+                            change_text = change_text.replace("%", "")
+                            price_change_24h = float(change_text)
                 except Exception as e:
-                    logger.error(f"Error extracting token from row: {str(e)}")
+                    logger.warning(f"Failed to extract price change: {str(e)}")
+                
+                # Extract volume
+                volume_24h = None
+                try:
+                    if len(cells) > 3:
+                        volume_element = cells[3].find_element(By.CSS_SELECTOR, "div")
+                        volume_text = volume_element.text.strip()
+                        # Remove $ and convert to float
+                        if volume_text.startswith("$"):
+                            volume_text = volume_text[1:].replace(",", "")
+                            # Handle K, M, B suffixes
+                            if "K" in volume_text:
+                                volume_24h = float(volume_text.replace("K", "")) * 1000
+                            elif "M" in volume_text:
+                                volume_24h = float(volume_text.replace("M", "")) * 1000000
+                            elif "B" in volume_text:
+                                volume_24h = float(volume_text.replace("B", "")) * 1000000000
+                            else:
+                                volume_24h = float(volume_text)
+                except Exception as e:
+                    logger.warning(f"Failed to extract volume: {str(e)}")
+                
+                # Create token object
+                token = Token(
+                    symbol=symbol,
+                    address=address,
+                    price=price,
+                    price_change_24h=price_change_24h,
+                    volume_24h=volume_24h,
+                    source="jup.ag/trenches"
+                )
+                
+                tokens.append(token)
+                logger.debug(f"Extracted token: {symbol}")
             
-            logger.info(f"Extracted {len(tokens)} tokens from the website")
+            except Exception as e:
+                logger.error(f"Error extracting token from row: {str(e)}")
         
-        except Exception as e:
-            logger.error(f"Error extracting tokens: {str(e)}")
-            # Take screenshot for debugging
-            try:
-                screenshot_path = "logs/website_error.png"
-                self.driver.save_screenshot(screenshot_path)
-                logger.info(f"Error screenshot saved to {screenshot_path}")
-            except:
-                pass
+        logger.info(f"Extracted {len(tokens)} tokens from the website")
         
         return tokens
+    
+    async def _run_blocking(self, func, *args):
+        """Run a blocking WebDriver call in the default executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, func, *args)
+    
+    async def initialize_browser(self):
+        """Start the browser for step-by-step use outside the monitor thread."""
+        await self._run_blocking(self._initialize)
+    
+    async def close_browser(self):
+        """Close a browser started with initialize_browser."""
+        await self._run_blocking(self._cleanup)
+    
+    async def load_page(self):
+        """Navigate to the website and wait for the trending table to load."""
+        await self._run_blocking(self._load_page)
+    
+    async def extract_tokens(self) -> List[Token]:
+        """
+        Read token information from the page loaded by load_page.
+        
+        Returns:
+            List of Token objects
+        """
+        return await self._run_blocking(self._parse_tokens)
+    
+    async def take_screenshot(self, path: str):
+        """
+        Save a screenshot of the current page.
+        
+        Args:
+            path: File to write the screenshot to
+        """
+        await self._run_blocking(self.driver.save_screenshot, path)
+    
+    async def check_for_new_tokens(self) -> List[Token]:
+        """
+        Reload the page once and notify about tokens not seen before.
+        
+        Returns:
+            List of new tokens
+        """
+        await self.load_page()
+        tokens = await self.extract_tokens()
+        new_tokens = self._detect_new_tokens(tokens)
+        
+        if new_tokens and self.notification_callback:
+            logger.info(f"Found {len(new_tokens)} new tokens")
+            for token in new_tokens:
+                try:
+                    await self.notification_callback(token.to_dict())
+                except Exception as e:
+                    logger.error(f"Error notifying about token {token.symbol}: {str(e)}")
+        
+        return new_tokens